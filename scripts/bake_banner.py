@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Regenerate the pre-rendered welcome banner in src/main.py.
+
+Renders BANNER_MARKUP through Rich once and prints the resulting ANSI text
+as a Python literal. Paste the output over BANNER_ANSI in src/main.py
+whenever BANNER_MARKUP changes.
+
+Usage: python scripts/bake_banner.py
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rich.console import Console
+
+from main import BANNER_MARKUP
+
+
+def main() -> int:
+    buffer = io.StringIO()
+    # Standard 16-color codes, so the literal works on any ANSI terminal
+    console = Console(file=buffer, force_terminal=True, color_system="standard", width=80)
+    console.print(BANNER_MARKUP)
+    
+    print("BANNER_ANSI = (")
+    for line in buffer.getvalue().splitlines(keepends=True):
+        print(f"    {line!r}")
+    print(")")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,37 +5,50 @@ A command-line weather application that fetches current conditions and forecasts
 using the OpenWeatherMap API.
 """
 
-import argparse
+import json
 import sys
 import os
-from datetime import datetime
+import shutil
+import signal
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add the src directory to the path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Initialize colorama for Windows terminal colors
-from colorama import init, Fore, Back, Style
-init(autoreset=True)
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich import box
-from rich.text import Text
-from rich.style import Style as RichStyle
+# Initialize colorama for Windows terminal colors. Other platforms understand
+# ANSI codes natively, so stdout is left unwrapped there.
+if sys.platform == "win32":
+    from colorama import init
+    init(autoreset=True)
 
 from utils import (
     get_current_weather,
     get_forecast,
+    prefetch_forecast,
     load_favorites,
     save_favorite,
     remove_favorite,
     format_temperature,
     get_weather_emoji,
+    set_cache_enabled,
+    cache_enabled,
+    get_cached_render,
+    save_cached_render,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    import argparse
+    
+    from rich.console import Console, RenderableType
+    from rich.panel import Panel
+    from rich.text import Text
+
+# Rich is imported on first use, so quick commands like -a and -r never
+# pay for loading it. Use _console() rather than this variable directly.
+console: Optional["Console"] = None
 
 # Weather-themed color styles
 SUNNY_STYLE = "bold yellow"
@@ -44,48 +57,238 @@ CLOUDY_STYLE = "dim white"
 COLD_STYLE = "bold cyan"
 HOT_STYLE = "bold red"
 
+# Temperature color bands. Each threshold tuple splits the scale into
+# len(colors) bands, looked up with bisect instead of an if/elif ladder.
+# Celsius bands (get_temp_style) are inclusive upper bounds.
+TEMP_BANDS_C = (0.0, 10.0, 20.0, 30.0)
+TEMP_STYLES_C = (COLD_STYLE, "cyan", "green", "yellow", HOT_STYLE)
+# Fahrenheit bands (current weather panel) are inclusive lower bounds:
+# cold, mild (50°F+), warm (68°F+), hot (86°F+)
+TEMP_BANDS_F = (50.0, 68.0, 86.0)
+TEMP_STYLES_F = ("bold cyan", "bold green", "bold yellow", "bold red")
+
+# Option strings for listing favorites (shared by the parser and main's fast path)
+LIST_FAVORITES_FLAGS = ("-l", "--list", "--list-favorites")
+
+# Favorites lists up to this length are printed without a Rich table
+PLAIN_FAVORITES_LIMIT = 50
+
+# Upper bound on concurrent API requests when fetching all favorites
+MAX_FETCH_WORKERS = 8
+
+# Part of every saved forecast render's key; bump it whenever the forecast
+# table's layout changes (columns, titles, styles) so old renders stop replaying
+FORECAST_RENDER_VERSION = 1
+
+
+def _console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
+        
+        # Rich asks the terminal for its size on every print unless the size
+        # is fixed. Where resizes can be detected (SIGWINCH, i.e. not on
+        # Windows), pin the size and update it from the signal instead.
+        if console.is_terminal and hasattr(signal, "SIGWINCH"):
+            console.size = shutil.get_terminal_size()
+            try:
+                signal.signal(signal.SIGWINCH, _on_terminal_resize)
+            except ValueError:
+                pass  # Not on the main thread; keep Rich's own size detection
+    return console
+
+
+def _on_terminal_resize(signum, frame) -> None:
+    """SIGWINCH handler that keeps the pinned console size current."""
+    if console is not None:
+        console.size = shutil.get_terminal_size()
+
+
+def _ansi_enabled() -> bool:
+    """
+    Check whether raw ANSI color codes should be written to stdout.
+    
+    Follows the environment rules Rich uses to pick a color system
+    (NO_COLOR, TERM=dumb, TTY_COMPATIBLE and FORCE_COLOR), so output written
+    without Rich is colored exactly when Rich's own output would be.
+    
+    Returns:
+        True if stdout should get color codes, False otherwise
+    """
+    environ = os.environ
+    if environ.get("NO_COLOR", "") != "":
+        return False
+    if environ.get("TERM", "").lower() in ("dumb", "unknown"):
+        return False
+    
+    tty_compatible = environ.get("TTY_COMPATIBLE", "")
+    if tty_compatible in ("0", "1"):
+        return tty_compatible == "1"
+    force_color = environ.get("FORCE_COLOR")
+    if force_color is not None:
+        return force_color != ""
+    return sys.stdout.isatty()
+
+
+def _color(text: str, code: str) -> str:
+    """
+    Wrap text in an ANSI color code when writing to a terminal.
+    
+    Used for the one-line messages of commands that never load Rich.
+    
+    Args:
+        text: Text to color
+        code: ANSI SGR code (e.g., "32" for green)
+        
+    Returns:
+        The colored text, or the text unchanged when output is redirected
+    """
+    if _ansi_enabled():
+        return f"\x1b[{code}m{text}\x1b[0m"
+    return text
+
+
+def _write(text: str) -> None:
+    """Write pre-rendered output to the terminal in a single call."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _emit(*lines: str) -> None:
+    """
+    Print several lines of Rich markup as one buffered write.
+    
+    Args:
+        lines: Markup strings, each printed on its own line
+    """
+    console = _console()
+    with console.capture() as capture:
+        for line in lines:
+            console.print(line)
+    _write(capture.get())
+
 
 def get_temp_style(temp: float) -> str:
     """Get a color style based on temperature."""
-    if temp <= 0:
-        return COLD_STYLE
-    elif temp <= 10:
-        return "cyan"
-    elif temp <= 20:
-        return "green"
-    elif temp <= 30:
-        return "yellow"
-    else:
-        return HOT_STYLE
+    return TEMP_STYLES_C[bisect_left(TEMP_BANDS_C, temp)]
 
 
-def show_welcome_banner():
-    """Display a colorful welcome banner."""
-    banner = """
+BANNER_MARKUP = """
 [bold cyan]╔══════════════════════════════════════════════════════════════╗[/bold cyan]
 [bold cyan]║[/bold cyan]  [bold yellow]☀️  [/bold yellow][bold white]W E A T H E R   D A S H B O A R D[/bold white][bold yellow]  🌧️[/bold yellow]   [bold cyan]║[/bold cyan]
 [bold cyan]║[/bold cyan]  [dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]  [bold cyan]║[/bold cyan]
 [bold cyan]║[/bold cyan]  [italic]Your personal weather companion in the terminal[/italic]    [bold cyan]║[/bold cyan]
 [bold cyan]╚══════════════════════════════════════════════════════════════╝[/bold cyan]
 """
-    console.print(banner)
 
 
-def show_main_menu() -> str:
-    """Display the main menu and get user choice."""
-    console.print()
-    console.print(Panel(
-        "[bold yellow]☀️[/bold yellow] [bold cyan]Weather Dashboard[/bold cyan] [bold blue]🌧️[/bold blue]\n\n"
-        "[bold white]What would you like to do?[/bold white]\n\n"
-        "[bold green][1][/bold green] 🌡️  [white]Get current weather for a city[/white]\n"
-        "[bold green][2][/bold green] 📅 [white]Get 5-day forecast for a city[/white]\n"
-        "[bold green][3][/bold green] ⭐ [white]Manage favorite cities[/white]\n"
-        "[bold green][4][/bold green] 🌍 [white]Get weather for all favorites[/white]\n"
-        "[bold red][5][/bold red] ❌ [white]Exit[/white]\n",
-        title="[bold yellow]☀️[/bold yellow] [bold white]Main Menu[/bold white] [bold blue]🌧️[/bold blue]",
+# BANNER_MARKUP pre-rendered to ANSI by scripts/bake_banner.py - rerun the
+# script whenever the markup changes. Lets the banner skip Rich entirely.
+BANNER_ANSI = (
+    '\n'
+    '\x1b[1;36m╔══════════════════════════════════════════════════════════════╗\x1b[0m\n'
+    '\x1b[1;36m║\x1b[0m  \x1b[1;33m☀️  \x1b[0m\x1b[1;37mW E A T H E R   D A S H B O A R D\x1b[0m\x1b[1;33m  🌧️\x1b[0m   \x1b[1;36m║\x1b[0m\n'
+    '\x1b[1;36m║\x1b[0m  \x1b[2m━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\x1b[0m  \x1b[1;36m║\x1b[0m\n'
+    '\x1b[1;36m║\x1b[0m  \x1b[3mYour personal weather companion in the terminal\x1b[0m    \x1b[1;36m║\x1b[0m\n'
+    '\x1b[1;36m╚══════════════════════════════════════════════════════════════╝\x1b[0m\n'
+    '\n'
+)
+BANNER_WIDTH = 64
+
+
+# The banner and menus never change, so their markup is parsed into Rich
+# Text once (with the same highlighting console.print would apply) and the
+# same renderables are reused on every redraw.
+@lru_cache(maxsize=None)
+def _banner() -> "Text":
+    """Build the welcome banner renderable."""
+    return _console().render_str(BANNER_MARKUP)
+
+
+@lru_cache(maxsize=None)
+def _main_menu_panel() -> "Panel":
+    """Build the main menu panel renderable."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    return Panel(
+        _console().render_str(
+            "[bold yellow]☀️[/bold yellow] [bold cyan]Weather Dashboard[/bold cyan] [bold blue]🌧️[/bold blue]\n\n"
+            "[bold white]What would you like to do?[/bold white]\n\n"
+            "[bold green][1][/bold green] 🌡️  [white]Get current weather for a city[/white]\n"
+            "[bold green][2][/bold green] 📅 [white]Get 5-day forecast for a city[/white]\n"
+            "[bold green][3][/bold green] ⭐ [white]Manage favorite cities[/white]\n"
+            "[bold green][4][/bold green] 🌍 [white]Get weather for all favorites[/white]\n"
+            "[bold red][5][/bold red] ❌ [white]Exit[/white]\n"
+        ),
+        title=Text.from_markup(
+            "[bold yellow]☀️[/bold yellow] [bold white]Main Menu[/bold white] [bold blue]🌧️[/bold blue]"
+        ),
         border_style="cyan",
         box=box.ROUNDED,
-    ))
+    )
+
+
+@lru_cache(maxsize=None)
+def _favorites_menu_panel() -> "Panel":
+    """Build the favorites menu panel renderable."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    return Panel(
+        _console().render_str(
+            "[bold magenta]⭐ Favorites Management[/bold magenta]\n\n"
+            "[bold green][1][/bold green] 📋 [white]List all favorite cities[/white]\n"
+            "[bold green][2][/bold green] ➕ [white]Add a city to favorites[/white]\n"
+            "[bold green][3][/bold green] ➖ [white]Remove a city from favorites[/white]\n"
+            "[bold yellow][4][/bold yellow] 🔙 [white]Back to main menu[/white]\n"
+        ),
+        title=Text.from_markup(
+            "[bold magenta]⭐[/bold magenta] [bold white]Favorites Menu[/bold white] [bold magenta]⭐[/bold magenta]"
+        ),
+        border_style="magenta",
+        box=box.ROUNDED,
+    )
+
+
+@lru_cache(maxsize=16)
+def _prerender(factory: Callable[[], "RenderableType"], width: int) -> str:
+    """
+    Render a static renderable to ANSI text once per terminal width.
+    
+    Args:
+        factory: One of the cached renderable builders above
+        width: Terminal width the output is laid out for
+        
+    Returns:
+        The rendered output, ready to write straight to stdout
+    """
+    console = _console()
+    with console.capture() as capture:
+        console.print(factory())
+    return capture.get()
+
+
+def show_welcome_banner():
+    """Display a colorful welcome banner."""
+    # Fall back to rendering through Rich when colors are off (by the same
+    # rules Rich applies, see _ansi_enabled) or the terminal is too narrow
+    # for the banner art
+    if _ansi_enabled() and shutil.get_terminal_size().columns >= BANNER_WIDTH:
+        _write(BANNER_ANSI)
+    else:
+        _write(_prerender(_banner, _console().width))
+
+
+def show_main_menu() -> str:
+    """Display the main menu and get user choice."""
+    from rich.prompt import Prompt
+    
+    _write("\n" + _prerender(_main_menu_panel, _console().width))
     
     choice = Prompt.ask(
         "[bold yellow]Enter your choice[/bold yellow]",
@@ -97,17 +300,9 @@ def show_main_menu() -> str:
 
 def show_favorites_menu() -> str:
     """Display the favorites management menu."""
-    console.print()
-    console.print(Panel(
-        "[bold magenta]⭐ Favorites Management[/bold magenta]\n\n"
-        "[bold green][1][/bold green] 📋 [white]List all favorite cities[/white]\n"
-        "[bold green][2][/bold green] ➕ [white]Add a city to favorites[/white]\n"
-        "[bold green][3][/bold green] ➖ [white]Remove a city from favorites[/white]\n"
-        "[bold yellow][4][/bold yellow] 🔙 [white]Back to main menu[/white]\n",
-        title="[bold magenta]⭐[/bold magenta] [bold white]Favorites Menu[/bold white] [bold magenta]⭐[/bold magenta]",
-        border_style="magenta",
-        box=box.ROUNDED,
-    ))
+    from rich.prompt import Prompt
+    
+    _write("\n" + _prerender(_favorites_menu_panel, _console().width))
     
     choice = Prompt.ask(
         "[bold yellow]Enter your choice[/bold yellow]",
@@ -117,6 +312,146 @@ def show_favorites_menu() -> str:
     return choice
 
 
+def _do_current_weather() -> None:
+    """Menu action: get current weather for a city."""
+    from rich.prompt import Prompt, Confirm
+    
+    console = _console()
+    city = Prompt.ask("\n[bold cyan]🏙️  Enter city name[/bold cyan]", default="London")
+    console.print()
+    _show_weather(city, _prefetch_both(city))
+    
+    # Offer to save as favorite
+    if Confirm.ask("\n[yellow]⭐ Add this city to favorites?[/yellow]", default=False):
+        if save_favorite(city):
+            console.print(f"[bold green]✓[/bold green] Added '[cyan]{city}[/cyan]' to favorites!")
+        else:
+            console.print(f"[yellow]'{city}' is already in favorites.[/yellow]")
+
+
+def _prefetch_both(city: str) -> Optional[dict]:
+    """
+    Fetch current weather and the 5-day forecast for a city at the same time.
+    
+    Looking up the forecast right after current conditions is the common
+    interactive workflow, so the forecast request rides along in the
+    background and lands in the response cache for when the user asks for
+    it. Only the current weather is waited on; the forecast keeps going
+    after this returns (or is dropped if the program exits first), and any
+    error it hits is left for get_forecast to report if the forecast is
+    actually requested.
+    
+    Args:
+        city: Name of the city
+        
+    Returns:
+        Current weather data, or None if the request failed
+    """
+    if not cache_enabled():
+        return get_current_weather(city)  # Nowhere to keep the forecast
+    
+    import threading
+    
+    # A daemon thread, so quitting right away doesn't wait on the request; an
+    # interrupted cache write is simply rolled back by SQLite
+    threading.Thread(target=prefetch_forecast, args=(city,), daemon=True).start()
+    return get_current_weather(city)
+
+
+def _do_forecast() -> None:
+    """Menu action: get the 5-day forecast for a city."""
+    from rich.prompt import Prompt
+    
+    city = Prompt.ask("\n[bold green]Enter city name[/bold green]", default="London")
+    _console().print()
+    display_forecast(city)
+
+
+def _do_list_favorites() -> None:
+    """Favorites menu action: list all favorite cities."""
+    _console().print()
+    display_favorites()
+
+
+def _do_add_favorite() -> None:
+    """Favorites menu action: add a city to favorites."""
+    from rich.prompt import Prompt
+    
+    console = _console()
+    city = Prompt.ask("\n[bold cyan]🏙️  Enter city name to add[/bold cyan]")
+    if save_favorite(city):
+        console.print(f"[bold green]✓[/bold green] Added '[cyan]{city}[/cyan]' to favorites!")
+    else:
+        console.print(f"[yellow]⚠️  '{city}' is already in favorites.[/yellow]")
+
+
+def _do_remove_favorite() -> None:
+    """Favorites menu action: remove a city from favorites."""
+    from rich.prompt import Prompt
+    from rich.text import Text
+    
+    console = _console()
+    favorites = load_favorites()
+    if not favorites:
+        console.print("[yellow]⚠️  No favorites to remove.[/yellow]")
+        return
+    
+    # Built with Text.append so city names skip markup parsing
+    listing = Text()
+    listing.append("\n⭐ Your favorites:\n", style="bold magenta")
+    for i, fav in enumerate(favorites, 1):
+        listing.append(f"  {i}.", style="cyan")
+        listing.append(f" {fav}\n")
+    console.print(listing, end="")
+    
+    city = Prompt.ask("\n[bold red]🗑️  Enter city name to remove[/bold red]")
+    if remove_favorite(city):
+        console.print(f"[bold green]✓[/bold green] Removed '[cyan]{city}[/cyan]' from favorites.")
+    else:
+        console.print(f"[bold red]✗[/bold red] '{city}' was not in favorites.")
+
+
+# Favorites menu choices; "4" (back to main menu) has no entry
+_FAVORITES_ACTIONS = {
+    "1": _do_list_favorites,
+    "2": _do_add_favorite,
+    "3": _do_remove_favorite,
+}
+
+
+def _do_favorites_menu() -> None:
+    """Menu action: run the favorites management submenu."""
+    while True:
+        action = _FAVORITES_ACTIONS.get(show_favorites_menu())
+        if action is None:
+            break  # Back to main menu
+        action()
+
+
+def _do_all_favorites() -> None:
+    """Menu action: get weather for all favorite cities."""
+    _console().print()
+    weather_for_favorites()
+
+
+def _do_exit() -> None:
+    """Menu action: say goodbye (interactive_mode stops after this)."""
+    _emit(
+        "\n[bold cyan]☀️  Thanks for using Weather Dashboard! Stay dry! ☔[/bold cyan]",
+        "[dim]Clear skies ahead! 🌤️[/dim]\n",
+    )
+
+
+# Main menu choices, matching the options shown by show_main_menu
+_MAIN_ACTIONS = {
+    "1": _do_current_weather,
+    "2": _do_forecast,
+    "3": _do_favorites_menu,
+    "4": _do_all_favorites,
+    "5": _do_exit,
+}
+
+
 def interactive_mode() -> int:
     """
     Run the CLI in interactive mode with prompts.
@@ -127,76 +462,14 @@ def interactive_mode() -> int:
     show_welcome_banner()
     
     while True:
-        choice = show_main_menu()
-        
-        if choice == "1":
-            # Get current weather
-            city = Prompt.ask("\n[bold cyan]🏙️  Enter city name[/bold cyan]", default="London")
-            console.print()
-            display_current_weather(city)
-            
-            # Offer to save as favorite
-            if Confirm.ask("\n[yellow]⭐ Add this city to favorites?[/yellow]", default=False):
-                if save_favorite(city):
-                    console.print(f"[bold green]✓[/bold green] Added '[cyan]{city}[/cyan]' to favorites!")
-                else:
-                    console.print(f"[yellow]'{city}' is already in favorites.[/yellow]")
-        
-        elif choice == "2":
-            # Get forecast
-            city = Prompt.ask("\n[bold green]Enter city name[/bold green]", default="London")
-            console.print()
-            display_forecast(city)
+        action = _MAIN_ACTIONS[show_main_menu()]
+        action()
         
-        elif choice == "3":
-            # Favorites management submenu
-            while True:
-                fav_choice = show_favorites_menu()
-                
-                if fav_choice == "1":
-                    console.print()
-                    display_favorites()
-                
-                elif fav_choice == "2":
-                    city = Prompt.ask("\n[bold cyan]🏙️  Enter city name to add[/bold cyan]")
-                    if save_favorite(city):
-                        console.print(f"[bold green]✓[/bold green] Added '[cyan]{city}[/cyan]' to favorites!")
-                    else:
-                        console.print(f"[yellow]⚠️  '{city}' is already in favorites.[/yellow]")
-                
-                elif fav_choice == "3":
-                    favorites = load_favorites()
-                    if not favorites:
-                        console.print("[yellow]⚠️  No favorites to remove.[/yellow]")
-                    else:
-                        console.print("\n[bold magenta]⭐ Your favorites:[/bold magenta]")
-                        for i, fav in enumerate(favorites, 1):
-                            console.print(f"  [cyan]{i}.[/cyan] {fav}")
-                        city = Prompt.ask("\n[bold red]🗑️  Enter city name to remove[/bold red]")
-                        if remove_favorite(city):
-                            console.print(f"[bold green]✓[/bold green] Removed '[cyan]{city}[/cyan]' from favorites.")
-                        else:
-                            console.print(f"[bold red]✗[/bold red] '{city}' was not in favorites.")
-                
-                elif fav_choice == "4":
-                    break  # Back to main menu
-        
-        elif choice == "4":
-            # Weather for all favorites
-            console.print()
-            weather_for_favorites()
-        
-        elif choice == "5":
-            # Exit
-            console.print("\n[bold cyan]☀️  Thanks for using Weather Dashboard! Stay dry! ☔[/bold cyan]")
-            console.print("[dim]Clear skies ahead! 🌤️[/dim]\n")
+        if action is _do_exit:
             return 0
         
         # Pause before showing menu again
-        console.print()
-        input("Press Enter to continue...")
-    
-    return 0
+        input("\nPress Enter to continue...")
 
 
 def display_current_weather(city: str) -> bool:
@@ -210,11 +483,54 @@ def display_current_weather(city: str) -> bool:
         True if successful, False otherwise
     """
     weather_data = get_current_weather(city)
+    return _show_weather(city, weather_data)
+
+
+def _show_weather(city: str, weather_data: Optional[dict]) -> bool:
+    """
+    Print the weather panel for already-fetched data, or an error if missing.
     
+    Args:
+        city: Name of the city that was requested
+        weather_data: API response from get_current_weather, or None
+        
+    Returns:
+        True if a panel was printed, False otherwise
+    """
+    console = _console()
     if weather_data is None:
         console.print(f"[bold red]❌ Error:[/bold red] Could not fetch weather for '[cyan]{city}[/cyan]'")
         return False
     
+    console.print(_render_weather_panel(weather_data))
+    return True
+
+
+# Body and title of the current-weather panel, filled in by _render_weather_panel
+_WEATHER_TEMPLATE = """
+{emoji} [bold cyan]{description}[/bold cyan]
+
+🌡️  Temperature: [{temp_color}]{temp}[/{temp_color}]
+🤔 Feels Like:  [yellow]{feels_like}[/yellow]
+💧 Humidity:    [blue]{humidity}%[/blue]
+💨 Wind Speed:  [green]{wind_speed} mph[/green]
+"""
+_WEATHER_TITLE_TEMPLATE = "[bold white]☀️ Weather in {city_name}, {country}[/bold white]"
+
+
+def _render_weather_panel(weather_data: dict) -> "Panel":
+    """
+    Build the current-weather panel from an API response.
+    
+    Args:
+        weather_data: API response from get_current_weather
+        
+    Returns:
+        Rich Panel ready to print
+    """
+    from rich import box
+    from rich.panel import Panel
+    
     # Extract weather information
     temp = weather_data["main"]["temp"]
     feels_like = weather_data["main"]["feels_like"]
@@ -228,35 +544,26 @@ def display_current_weather(city: str) -> bool:
     weather_id = weather_data["weather"][0]["id"]
     emoji = get_weather_emoji(weather_id)
     
-    # Determine temperature color based on value (Fahrenheit thresholds)
-    if temp >= 86:  # Hot (86°F+)
-        temp_color = "bold red"
-    elif temp >= 68:  # Warm (68°F+)
-        temp_color = "bold yellow"
-    elif temp >= 50:  # Mild (50°F+)
-        temp_color = "bold green"
-    else:  # Cold
-        temp_color = "bold cyan"
-    
     # Create a beautiful panel with weather info
-    weather_info = f"""
-{emoji} [bold cyan]{description}[/bold cyan]
-
-🌡️  Temperature: [{temp_color}]{format_temperature(temp)}[/{temp_color}]
-🤔 Feels Like:  [yellow]{format_temperature(feels_like)}[/yellow]
-💧 Humidity:    [blue]{humidity}%[/blue]
-💨 Wind Speed:  [green]{wind_speed} mph[/green]
-"""
-    
-    panel = Panel(
-        weather_info,
-        title=f"[bold white]☀️ Weather in {city_name}, {country}[/bold white]",
+    fields = {
+        "emoji": emoji,
+        "description": description,
+        # Temperature color based on value (Fahrenheit thresholds)
+        "temp_color": TEMP_STYLES_F[bisect_right(TEMP_BANDS_F, temp)],
+        "temp": format_temperature(temp),
+        "feels_like": format_temperature(feels_like),
+        "humidity": humidity,
+        "wind_speed": wind_speed,
+        "city_name": city_name,
+        "country": country,
+    }
+    
+    return Panel(
+        _WEATHER_TEMPLATE.format_map(fields),
+        title=_WEATHER_TITLE_TEMPLATE.format_map(fields),
         border_style="cyan",
         box=box.ROUNDED,
     )
-    
-    console.print(panel)
-    return True
 
 
 def display_forecast(city: str) -> bool:
@@ -269,12 +576,32 @@ def display_forecast(city: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    import hashlib
+    from datetime import date
+    
+    from rich import box
+    from rich.table import Table
+    
+    console = _console()
     forecast_data = get_forecast(city)
     
     if forecast_data is None:
         console.print(f"[bold red]❌ Error:[/bold red] Could not fetch forecast for '[cyan]{city}[/cyan]'")
         return False
     
+    # Unchanged data at the same width renders identically (for one version
+    # of the table layout), so repeat lookups replay the saved output instead
+    # of rebuilding the table
+    render_key = hashlib.blake2b(
+        f"{FORECAST_RENDER_VERSION}:{console.width}:{console.color_system}:"
+        f"{json.dumps(forecast_data)}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    rendered = get_cached_render(render_key)
+    if rendered is not None:
+        _write(rendered)
+        return True
+    
     city_name = forecast_data["city"]["name"]
     country = forecast_data["city"]["country"]
     
@@ -294,30 +621,37 @@ def display_forecast(city: str) -> bool:
     table.add_column("💧 Humidity", style="blue", header_style="bold blue")
     table.add_column("💨 Wind", style="green", header_style="bold green")
     
-    # Get forecast entries (every 8th entry for daily forecast, or show all for detailed)
-    forecast_list = forecast_data["list"]
-    
-    # Show one entry per day (every 8 entries = 24 hours since data is 3-hourly)
-    for i in range(0, min(40, len(forecast_list)), 8):
-        entry = forecast_list[i]
-        
-        # Parse and format date/time to be more readable
-        dt_txt = entry["dt_txt"]
-        dt_obj = datetime.strptime(dt_txt, "%Y-%m-%d %H:%M:%S")
-        formatted_date = dt_obj.strftime("%a, %b %d")  # e.g., "Mon, Dec 09"
-        
-        temp = format_temperature(entry["main"]["temp"])
-        feels_like = format_temperature(entry["main"]["feels_like"])
-        description = entry["weather"][0]["description"].title()
-        humidity = f"{entry['main']['humidity']}%"
-        wind = f"{entry['wind']['speed']} mph"
-        
-        weather_id = entry["weather"][0]["id"]
-        emoji = get_weather_emoji(weather_id)
-        
-        table.add_row(formatted_date, temp, feels_like, f"{emoji} {description}", humidity, wind)
-    
-    console.print(table)
+    # Helpers used for every cell, bound once as locals (rather than looked up
+    # as globals on each row)
+    parse_date = date.fromisoformat
+    fmt_temp = format_temperature
+    emoji = get_weather_emoji
+    
+    # Show one entry per day (every 8 entries = 24 hours since data is 3-hourly),
+    # building all row cells up front and then adding them to the table
+    rows = [
+        (
+            # e.g., "Mon, Dec 09"; dt_txt is "YYYY-MM-DD HH:MM:SS", so the
+            # date part can be read directly instead of going through strptime
+            parse_date(entry["dt_txt"][:10]).strftime("%a, %b %d"),
+            fmt_temp(entry["main"]["temp"]),
+            fmt_temp(entry["main"]["feels_like"]),
+            f"{emoji(entry['weather'][0]['id'])} {entry['weather'][0]['description'].title()}",
+            f"{entry['main']['humidity']}%",
+            f"{entry['wind']['speed']} mph",
+        )
+        for entry in forecast_data["list"][:40:8]
+    ]
+    
+    for row in rows:
+        table.add_row(*row)
+    
+    with console.capture() as capture:
+        console.print(table)
+    
+    rendered = capture.get()
+    save_cached_render(render_key, rendered)
+    _write(rendered)
     return True
 
 
@@ -326,10 +660,25 @@ def display_favorites() -> None:
     favorites = load_favorites()
     
     if not favorites:
-        console.print("[yellow]⚠️  No favorite cities saved yet.[/yellow]")
-        console.print("Use [cyan]--add-favorite <city>[/cyan] or [cyan]-a <city>[/cyan] to add one!")
+        _write(
+            _color("⚠️  No favorite cities saved yet.", "33") + "\n"
+            f"Use {_color('--add-favorite <city>', '36')} or {_color('-a <city>', '36')} to add one!\n"
+        )
+        return
+    
+    # Typical lists are short, so lay them out by hand and skip loading
+    # Rich's table machinery (this keeps `weather.py -l` Rich-free)
+    if len(favorites) <= PLAIN_FAVORITES_LIMIT:
+        lines = [_color("⭐ Favorite Cities", "1;35")]
+        lines.extend(
+            f"  {_color(f'{i:>2}.', '36')} {city}" for i, city in enumerate(favorites, 1)
+        )
+        _write("\n".join(lines) + "\n")
         return
     
+    from rich import box
+    from rich.table import Table
+    
     table = Table(
         title="⭐ Favorite Cities",
         box=box.ROUNDED,
@@ -344,26 +693,156 @@ def display_favorites() -> None:
     for i, city in enumerate(favorites, 1):
         table.add_row(str(i), city)
     
-    console.print(table)
+    _console().print(table)
 
 
 def weather_for_favorites() -> None:
     """Display current weather for all favorite cities."""
+    console = _console()
     favorites = load_favorites()
     
     if not favorites:
         console.print("[yellow]⚠️  No favorite cities saved yet.[/yellow]")
         return
     
-    console.print("[bold magenta]⭐ Weather for your favorite cities:[/bold magenta]\n")
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Fetch all cities concurrently - each lookup is a network round-trip,
+    # so total wait becomes the slowest request rather than the sum
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(favorites))) as executor:
+        results = list(executor.map(get_current_weather, favorites))
+    
+    # Render every panel into one capture buffer and write it in a single
+    # call, instead of one terminal round-trip per favorite city
+    with console.capture() as capture:
+        console.print("[bold magenta]⭐ Weather for your favorite cities:[/bold magenta]\n")
+        
+        for city, weather_data in zip(favorites, results):
+            _show_weather(city, weather_data)
+            console.print()  # Add spacing between cities
+    
+    _write(capture.get())
+
+
+# Every option create_parser accepts: flag -> (attribute, takes a value)
+_OPTIONS = {
+    "-c": ("city", True),
+    "--city": ("city", True),
+    "-f": ("forecast", False),
+    "--forecast": ("forecast", False),
+    "-s": ("favorites", False),
+    "--favorites": ("favorites", False),
+    "--show": ("favorites", False),
+    **{flag: ("list_favorites", False) for flag in LIST_FAVORITES_FLAGS},
+    "-a": ("add_favorite", True),
+    "--add": ("add_favorite", True),
+    "--add-favorite": ("add_favorite", True),
+    "-r": ("remove_favorite", True),
+    "--remove": ("remove_favorite", True),
+    "--remove-favorite": ("remove_favorite", True),
+    "--no-cache": ("no_cache", False),
+}
+
+# Parsed-argument defaults, matching what argparse would set
+_ARG_DEFAULTS = {
+    "city_name": None,
+    "city": None,
+    "forecast": False,
+    "favorites": False,
+    "list_favorites": False,
+    "add_favorite": None,
+    "remove_favorite": None,
+    "no_cache": False,
+}
+
+
+def _parse_args(argv: list) -> Optional[SimpleNamespace]:
+    """
+    Parse command-line arguments without argparse.
+    
+    Understands every option in _OPTIONS, with values given as "-c VALUE",
+    "--city VALUE" or "--city=VALUE", plus one positional city name.
+    
+    Args:
+        argv: Arguments after the program name
+        
+    Returns:
+        Namespace with the same attributes argparse would set, or None if
+        argv needs argparse (help, unknown or abbreviated options, errors)
+    """
+    args = dict(_ARG_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        i += 1
+        
+        if token == "-" or not token.startswith("-"):
+            if args["city_name"] is not None:
+                return None  # Extra positional; let argparse report it
+            args["city_name"] = token
+            continue
+        
+        flag, has_value, value = token.partition("=") if token.startswith("--") else (token, "", "")
+        option = _OPTIONS.get(flag)
+        if option is None:
+            return None
+        
+        dest, takes_value = option
+        if not takes_value:
+            if has_value:
+                return None
+            args[dest] = True
+        elif has_value:
+            args[dest] = value
+        elif i < len(argv) and not argv[i].startswith("-"):
+            args[dest] = argv[i]
+            i += 1
+        else:
+            return None  # Missing value
+    
+    return SimpleNamespace(**args)
+
+
+class _CommandLineParser:
+    """
+    Argument parser for the CLI with the parts of argparse's interface main uses.
+    
+    Ordinary command lines are handled by _parse_args. argparse is only
+    imported to print help or to report a usage error.
+    """
+    
+    prog = "weather"
     
-    for city in favorites:
-        display_current_weather(city)
-        console.print()  # Add spacing between cities
+    def parse_args(self, args: Optional[list] = None) -> SimpleNamespace:
+        """
+        Parse command-line arguments.
+        
+        Args:
+            args: Arguments to parse (defaults to sys.argv[1:])
+            
+        Returns:
+            Namespace of parsed arguments
+        """
+        argv = sys.argv[1:] if args is None else list(args)
+        parsed = _parse_args(argv)
+        if parsed is None:
+            parsed = _argparse_parser().parse_args(argv)
+        return parsed
+    
+    def print_help(self) -> None:
+        """Print the full usage and help text."""
+        _argparse_parser().print_help()
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser() -> _CommandLineParser:
     """Create and configure the argument parser."""
+    return _CommandLineParser()
+
+
+def _argparse_parser() -> "argparse.ArgumentParser":
+    """Build the argparse parser used for help text and usage errors."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog="weather",
         description="🌤️  Weather Dashboard CLI - Get weather information from your terminal!",
@@ -374,6 +853,7 @@ Examples:
   weather.py -a Paris            Add Paris to favorites
   weather.py -l                  List favorite cities
   weather.py -s                  Show weather for all favorites
+  weather.py London --no-cache   Skip cached data and fetch fresh weather
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -408,7 +888,7 @@ Examples:
     )
     
     parser.add_argument(
-        "-l", "--list", "--list-favorites",
+        *LIST_FAVORITES_FLAGS,
         action="store_true",
         dest="list_favorites",
         help="List all saved favorite cities",
@@ -430,6 +910,13 @@ Examples:
         help="Remove a city from favorites",
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Always fetch fresh data instead of using cached responses",
+    )
+    
     return parser
 
 
@@ -440,26 +927,40 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    argv = sys.argv[1:]
+    
+    # Fast paths for the most common one-shot commands, skipping the parser.
+    # A blank city name is left to the parser, which falls back to help.
+    if len(argv) == 1:
+        if argv[0].strip() and not argv[0].startswith("-"):
+            return 0 if display_current_weather(argv[0]) else 1
+        if argv[0] in LIST_FAVORITES_FLAGS:
+            display_favorites()
+            return 0
+    
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    if args.no_cache:
+        set_cache_enabled(False)
     
-    # If no arguments provided, run interactive mode
-    if len(sys.argv) == 1:
+    # If no arguments provided (other than --no-cache), run interactive mode
+    if len(sys.argv) == 1 or (args.no_cache and len(sys.argv) == 2):
         return interactive_mode()
     
     # Handle favorites management
     if args.add_favorite:
         if save_favorite(args.add_favorite):
-            console.print(f"[green]✓[/green] Added '{args.add_favorite}' to favorites!")
+            print(f"{_color('✓', '32')} Added '{args.add_favorite}' to favorites!")
         else:
-            console.print(f"[yellow]'{args.add_favorite}' is already in favorites.[/yellow]")
+            print(_color(f"'{args.add_favorite}' is already in favorites.", "33"))
         return 0
     
     if args.remove_favorite:
         if remove_favorite(args.remove_favorite):
-            console.print(f"[green]✓[/green] Removed '{args.remove_favorite}' from favorites.")
+            print(f"{_color('✓', '32')} Removed '{args.remove_favorite}' from favorites.")
         else:
-            console.print(f"[red]'{args.remove_favorite}' was not in favorites.[/red]")
+            print(_color(f"'{args.remove_favorite}' was not in favorites.", "31"))
         return 0
     
     if args.list_favorites:
@@ -7,19 +7,129 @@ and formatting for the Weather Dashboard CLI.
 
 import os
 import json
-from typing import Optional
+import stat
+import time
+import atexit
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
 from pathlib import Path
 
-import requests
-from dotenv import load_dotenv
+if TYPE_CHECKING:
+    import sqlite3
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson is an optional speedup for parsing API responses and the favorites
+# file; fall back to the standard library when it isn't installed
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+    
+    def _dumps_pretty(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+    
+    def _dumps_pretty(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
 
 # Constants
-API_KEY = os.getenv("OPENWEATHERMAP_API_KEY", "")
+# Read from the environment (and .env file) on first use; see _load_env_once
+API_KEY: Optional[str] = None
 BASE_URL = "https://api.openweathermap.org/data/2.5"
+_CURRENT_URL = f"{BASE_URL}/weather"
+_FORECAST_URL = f"{BASE_URL}/forecast"
 FAVORITES_FILE = Path(__file__).parent.parent / "favorites.json"
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "weather-dashboard"
+
+# How long API responses stay fresh, in seconds
+CURRENT_CACHE_TTL = 5 * 60
+FORECAST_CACHE_TTL = 30 * 60
+
+# The parts of a forecast response that display_forecast shows; everything
+# else is dropped before caching (None keeps a value as-is, and a nested dict
+# applies to each item of a list)
+_FORECAST_FIELDS = {
+    "city": {"name": None, "country": None},
+    "list": {
+        "dt_txt": None,
+        "main": {"temp": None, "feels_like": None, "humidity": None},
+        "weather": {"id": None, "description": None},
+        "wind": {"speed": None},
+    },
+}
+
+# Expired responses are kept this long (seconds) so a forecast with an ETag
+# can be revalidated with a conditional request instead of re-downloaded
+STALE_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Bump when the api_cache table changes; older cache databases are rebuilt
+_CACHE_SCHEMA_VERSION = 1
+
+# Rendered output is keyed on its input data, so it never goes stale; old
+# entries are only kept around this long (seconds) to bound the cache size
+RENDER_CACHE_MAX_AGE = 24 * 60 * 60
+
+_cache_enabled = True
+# Cache key -> (expiry time, response data, ETag), in front of the SQLite cache
+_memory_cache: dict = {}
+# SQLite connection (see _cache_db); shared by the favorites fetch threads
+_cache_conn: Optional["sqlite3.Connection"] = None
+_cache_lock = threading.Lock()
+
+# Parsed favorites, their casefolded names for duplicate checks, and the file
+# version they were read from (see load_favorites)
+_fav_cache: Optional[list] = None
+_fav_keys: set = set()
+_fav_cache_stamp: Optional[tuple] = None
+
+# One pooled HTTP session for every API call, so repeated lookups (e.g. all
+# favorites) reuse the open TLS connection instead of reconnecting each time.
+# Created on first use (see _get_session) so commands that never touch the
+# network don't pay for importing requests.
+_SESSION = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """
+    Return the shared HTTP session, creating it on first use.
+    
+    Returns:
+        requests.Session with a connection pool sized to match
+        main.MAX_FETCH_WORKERS
+    """
+    global _SESSION
+    with _session_lock:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+            atexit.register(session.close)
+            _SESSION = session
+    return _SESSION
+
+
+def _load_env_once() -> None:
+    """
+    Read the API key the first time it's needed.
+    
+    The .env file is only parsed (and python-dotenv only imported) when the
+    key isn't already set in the environment, e.g. by CI or a container.
+    """
+    global API_KEY
+    if API_KEY is None:
+        if not os.environ.get("OPENWEATHERMAP_API_KEY"):
+            from dotenv import load_dotenv
+            
+            load_dotenv()
+        API_KEY = os.getenv("OPENWEATHERMAP_API_KEY", "")
 
 
 def get_api_key() -> str:
@@ -32,6 +142,7 @@ def get_api_key() -> str:
     Raises:
         ValueError: If API key is not set
     """
+    _load_env_once()
     if not API_KEY:
         raise ValueError(
             "OpenWeatherMap API key not found. "
@@ -40,6 +151,246 @@ def get_api_key() -> str:
     return API_KEY
 
 
+def set_cache_enabled(enabled: bool) -> None:
+    """
+    Turn the API response cache on or off (used by the --no-cache flag).
+    
+    Args:
+        enabled: False to always fetch fresh data from the API
+    """
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def cache_enabled() -> bool:
+    """
+    Check whether API responses are being cached.
+    
+    Returns:
+        True unless caching was turned off with set_cache_enabled
+    """
+    return _cache_enabled
+
+
+def _cache_db() -> Optional["sqlite3.Connection"]:
+    """
+    Open the on-disk response cache, creating it on first use.
+    
+    Rows that expired more than STALE_CACHE_MAX_AGE ago are purged each
+    time the database is opened.
+    
+    Returns:
+        The shared connection, or None if the cache can't be opened
+    """
+    global _cache_conn
+    import sqlite3
+    
+    if _cache_conn is None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(CACHE_DIR / "cache.db", timeout=5, check_same_thread=False)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _CACHE_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS api_cache")
+                conn.execute(f"PRAGMA user_version = {_CACHE_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache "
+                "(k TEXT PRIMARY KEY, v BLOB, exp REAL, etag TEXT)"
+            )
+            conn.execute(
+                "DELETE FROM api_cache WHERE exp < ?", (time.time() - STALE_CACHE_MAX_AGE,)
+            )
+            conn.commit()
+        except (sqlite3.Error, IOError):
+            return None
+        _cache_conn = conn
+    return _cache_conn
+
+
+def clear_weather_cache() -> None:
+    """Forget all cached API responses, in memory and on disk."""
+    import sqlite3
+    
+    _memory_cache.clear()
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return
+        try:
+            conn.execute("DELETE FROM api_cache")
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _cache_key(endpoint: str, city: str, units: str) -> str:
+    """
+    Build a cache key for a city.
+    
+    Case and surrounding whitespace are ignored, so "London", "london "
+    and "LONDON" share one entry.
+    
+    Args:
+        endpoint: API endpoint name ("weather" or "forecast")
+        city: Name of the city as entered by the user
+        units: Units requested from the API (e.g., "imperial")
+        
+    Returns:
+        Cache key string
+    """
+    return f"{endpoint}:{city.strip().lower()}:{units}"
+
+
+def _cache_entry(key: str) -> Optional[tuple]:
+    """
+    Look up a cached API response, checking memory first and then disk.
+    
+    Args:
+        key: Cache key from _cache_key
+        
+    Returns:
+        (expiry time, response data, ETag or None) tuple, which may be
+        expired, or None on a miss
+    """
+    if not _cache_enabled:
+        return None
+    
+    entry = _memory_cache.get(key)
+    if entry is None:
+        import sqlite3
+        
+        with _cache_lock:
+            conn = _cache_db()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT exp, v, etag FROM api_cache WHERE k = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        try:
+            entry = (row[0], _loads(row[1]), row[2])
+        except ValueError:
+            return None
+        _memory_cache[key] = entry
+    return entry
+
+
+def _read_cache(key: str) -> Optional[dict]:
+    """
+    Look up a fresh cached API response.
+    
+    Args:
+        key: Cache key from _cache_key
+        
+    Returns:
+        Cached response data, or None on a miss or expired entry
+    """
+    entry = _cache_entry(key)
+    if entry is not None and time.time() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _write_cache(key: str, data: dict, ttl: float, etag: Optional[str] = None) -> None:
+    """
+    Store an API response in memory and on disk.
+    
+    Args:
+        key: Cache key from _cache_key
+        data: Response data to store
+        ttl: Seconds the entry stays fresh
+        etag: ETag header from the response, if the server sent one
+    """
+    if not _cache_enabled:
+        return
+    
+    expires_at = time.time() + ttl
+    _memory_cache[key] = (expires_at, data, etag)
+    
+    import sqlite3
+    
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return  # Caching is best-effort; the response is still returned
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO api_cache (k, v, exp, etag) VALUES (?, ?, ?, ?)",
+                (key, _dumps(data), expires_at, etag),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def get_cached_render(key: str) -> Optional[str]:
+    """
+    Look up previously rendered terminal output.
+    
+    Args:
+        key: Digest identifying the data and render settings
+        
+    Returns:
+        The cached output text, or None on a miss
+    """
+    if not _cache_enabled:
+        return None
+    
+    try:
+        with open(CACHE_DIR / "render" / key, "r", encoding="utf-8") as f:
+            return f.read()
+    except IOError:
+        return None
+
+
+def save_cached_render(key: str, text: str) -> None:
+    """
+    Store rendered terminal output, dropping entries older than a day.
+    
+    Args:
+        key: Digest identifying the data and render settings
+        text: Rendered output to store
+    """
+    if not _cache_enabled:
+        return
+    
+    render_dir = CACHE_DIR / "render"
+    try:
+        render_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=render_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, render_dir / key)
+        
+        cutoff = time.time() - RENDER_CACHE_MAX_AGE
+        for entry in os.scandir(render_dir):
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+    except IOError:
+        pass  # Caching is best-effort
+
+
+def _pick_fields(data, spec: Optional[dict]):
+    """
+    Copy only the fields named in spec out of parsed JSON data.
+    
+    Args:
+        data: Parsed JSON value
+        spec: Field spec like _FORECAST_FIELDS, or None to keep data whole
+        
+    Returns:
+        The trimmed copy; fields missing from data are skipped
+    """
+    if isinstance(data, list):
+        return [_pick_fields(item, spec) for item in data]
+    if spec is None or not isinstance(data, dict):
+        return data
+    return {key: _pick_fields(data[key], sub) for key, sub in spec.items() if key in data}
+
+
 def get_current_weather(city: str) -> Optional[dict]:
     """
     Fetch current weather data for a city from OpenWeatherMap API.
@@ -50,22 +401,29 @@ def get_current_weather(city: str) -> Optional[dict]:
     Returns:
         Dictionary containing weather data, or None if request failed
     """
-    try:
-        api_key = get_api_key()
-    except ValueError:
-        return None
+    _load_env_once()
+    if not API_KEY:
+        return None  # No key configured (see get_api_key)
     
-    url = f"{BASE_URL}/weather"
     params = {
         "q": city,
-        "appid": api_key,
+        "appid": API_KEY,
         "units": "imperial",  # Use Fahrenheit for US users
     }
     
+    cache_key = _cache_key("weather", city, params["units"])
+    cached = _read_cache(cache_key)
+    if cached is not None:
+        return cached
+    
+    import requests
+    
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _get_session().get(_CURRENT_URL, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
+        data = _loads(response.content)
+        _write_cache(cache_key, data, CURRENT_CACHE_TTL)
+        return data
     except requests.exceptions.HTTPError as e:
         if response.status_code == 404:
             return None  # City not found
@@ -80,34 +438,72 @@ def get_current_weather(city: str) -> Optional[dict]:
     except requests.exceptions.RequestException as e:
         print(f"Error fetching weather data: {e}")
         return None
+    except ValueError:
+        print("Error: The weather service returned an invalid response.")
+        return None
 
 
-def get_forecast(city: str) -> Optional[dict]:
+def _fetch_forecast(city: str) -> Optional[dict]:
     """
-    Fetch 5-day weather forecast for a city from OpenWeatherMap API.
+    Fetch the 5-day forecast for a city, leaving request errors to the caller.
     
     Args:
         city: Name of the city (e.g., "London" or "New York,US")
         
     Returns:
-        Dictionary containing forecast data, or None if request failed
+        Forecast data trimmed to the fields in _FORECAST_FIELDS, or None if
+        no API key is configured
+        
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+        ValueError: If the response body was not valid JSON
     """
-    try:
-        api_key = get_api_key()
-    except ValueError:
-        return None
+    _load_env_once()
+    if not API_KEY:
+        return None  # No key configured (see get_api_key)
     
-    url = f"{BASE_URL}/forecast"
     params = {
         "q": city,
-        "appid": api_key,
+        "appid": API_KEY,
         "units": "imperial",  # Use Fahrenheit for US users
     }
     
-    try:
-        response = requests.get(url, params=params, timeout=10)
+    cache_key = _cache_key("forecast", city, params["units"])
+    entry = _cache_entry(cache_key)
+    if entry is not None and time.time() < entry[0]:
+        return entry[1]
+    
+    # An expired copy with an ETag can be revalidated instead of re-downloaded
+    stale_etag = entry[2] if entry is not None else None
+    headers = {"If-None-Match": stale_etag} if stale_etag else {}
+    
+    response = _get_session().get(_FORECAST_URL, params=params, headers=headers, timeout=10)
+    etag = response.headers.get("ETag")
+    if stale_etag and response.status_code == 304:
+        data = entry[1]  # Not modified; reuse the cached copy as-is
+        etag = etag or stale_etag
+    else:
         response.raise_for_status()
-        return response.json()
+        data = _pick_fields(_loads(response.content), _FORECAST_FIELDS)
+    _write_cache(cache_key, data, FORECAST_CACHE_TTL, etag)
+    return data
+
+
+def get_forecast(city: str) -> Optional[dict]:
+    """
+    Fetch 5-day weather forecast for a city from OpenWeatherMap API.
+    
+    Args:
+        city: Name of the city (e.g., "London" or "New York,US")
+        
+    Returns:
+        Dictionary containing forecast data, trimmed to the fields in
+        _FORECAST_FIELDS, or None if request failed
+    """
+    import requests
+    
+    try:
+        return _fetch_forecast(city)
     except requests.exceptions.HTTPError:
         return None
     except requests.exceptions.ConnectionError:
@@ -119,42 +515,170 @@ def get_forecast(city: str) -> Optional[dict]:
     except requests.exceptions.RequestException as e:
         print(f"Error fetching forecast data: {e}")
         return None
+    except ValueError:
+        print("Error: The weather service returned an invalid response.")
+        return None
+
+
+def prefetch_forecast(city: str) -> None:
+    """
+    Fetch a city's forecast into the response cache without printing errors.
+    
+    Meant for background requests made ahead of time; if one fails, the
+    later get_forecast call retries and reports the error itself.
+    
+    Args:
+        city: Name of the city (e.g., "London" or "New York,US")
+    """
+    import requests
+    
+    try:
+        _fetch_forecast(city)
+    except (requests.exceptions.RequestException, ValueError):
+        pass
+
+
+def _favorites_stamp() -> Optional[tuple]:
+    """
+    Identify the current version of the favorites file.
+    
+    The size is included because two writes within the filesystem's
+    timestamp resolution can leave the modification time unchanged.
+    
+    Returns:
+        (path, modification time in ns, size) tuple, or None if the file
+        doesn't exist
+    """
+    path = os.fspath(FAVORITES_FILE)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _cache_favorites(favorites: Optional[list], stamp: Optional[tuple]) -> None:
+    """
+    Remember a favorites list and the file version it matches.
+    
+    Args:
+        favorites: The list to cache, or None to clear the cache
+        stamp: Result of _favorites_stamp for the file the list came from
+    """
+    global _fav_cache, _fav_keys, _fav_cache_stamp
+    _fav_cache = favorites
+    _fav_keys = {fav.casefold() for fav in favorites} if favorites else set()
+    _fav_cache_stamp = stamp
+
+
+def invalidate_favorites() -> None:
+    """Drop the in-memory favorites so the next load re-reads the file."""
+    _cache_favorites(None, None)
 
 
 def load_favorites() -> list:
     """
     Load favorite cities from the JSON file.
     
+    The parsed list is kept in memory and reused until the file changes,
+    so repeated calls only cost a stat.
+    
     Returns:
-        List of favorite city names
+        List of favorite city names (a copy the caller may modify)
     """
-    if not FAVORITES_FILE.exists():
-        return []
+    stamp = _favorites_stamp()
+    if _fav_cache is not None and stamp == _fav_cache_stamp:
+        return list(_fav_cache)
     
-    try:
-        with open(FAVORITES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("favorites", [])
-    except (json.JSONDecodeError, IOError):
-        return []
+    favorites = []
+    if stamp is not None:
+        try:
+            with open(stamp[0], "rb") as f:
+                favorites = _loads(f.read()).get("favorites", [])
+        except (ValueError, IOError):
+            pass  # A corrupted file is treated as having no favorites
+    
+    _cache_favorites(favorites, stamp)
+    return list(favorites)
+
+
+def _create_temp_file(path: str) -> tuple:
+    """
+    Create a new temporary file next to path for writing.
+    
+    Unlike mkstemp, which always uses mode 0600, the file is created with
+    0666 and left to the umask, just as an ordinary new file would be.
+    
+    Args:
+        path: Path of the file the temporary file will replace
+        
+    Returns:
+        (file descriptor, temporary file path) tuple
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        tmp_path = f"{path}.{os.urandom(4).hex()}.tmp"
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temporary file name next to {path}")
 
 
 def save_favorites(favorites: list) -> bool:
     """
     Save favorite cities to the JSON file.
     
+    The list is written to a temporary file next to the favorites file and
+    then renamed over it, so an interrupted save can't leave a truncated file.
+    An existing file's permissions carry over to the new one.
+    
     Args:
         favorites: List of city names to save
         
     Returns:
         True if successful, False otherwise
     """
+    path = os.fspath(FAVORITES_FILE)
+    tmp_path = None
     try:
-        with open(FAVORITES_FILE, "w", encoding="utf-8") as f:
-            json.dump({"favorites": favorites}, f, indent=2)
-        return True
+        fd, tmp_path = _create_temp_file(path)
+        with os.fdopen(fd, "wb", buffering=65536) as f:
+            f.write(_dumps_pretty({"favorites": favorites}))
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass  # First save; keep the umask default the file was created with
+        os.replace(tmp_path, path)
     except IOError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        # The in-memory list may no longer match the file; reload next time
+        invalidate_favorites()
+        return False
+    
+    _cache_favorites(list(favorites), _favorites_stamp())
+    return True
+
+
+def _mutate_favorites(mutator: Callable[[list], bool]) -> bool:
+    """
+    Apply one read-modify-write change to the favorites file.
+    
+    The list comes from load_favorites, so an unchanged file isn't re-read,
+    and it is only written back if the change did something.
+    
+    Args:
+        mutator: Edits the list in place; returns True if it changed it
+        
+    Returns:
+        The mutator's result
+    """
+    favorites = load_favorites()
+    if not mutator(favorites):
         return False
+    save_favorites(favorites)
+    return True
 
 
 def save_favorite(city: str) -> bool:
@@ -167,18 +691,18 @@ def save_favorite(city: str) -> bool:
     Returns:
         True if city was added, False if already exists
     """
-    favorites = load_favorites()
+    # Store the name as typed (e.g. "New York,US"), only trimmed
+    city = city.strip()
     
-    # Normalize city name for comparison
-    city_normalized = city.strip().title()
-    
-    # Check if already in favorites (case-insensitive)
-    if any(fav.lower() == city_normalized.lower() for fav in favorites):
-        return False
+    def add(favorites: list) -> bool:
+        # Check if already in favorites (case-insensitive); load_favorites
+        # keeps the casefolded names alongside the cached list
+        if city.casefold() in _fav_keys:
+            return False
+        favorites.append(city)
+        return True
     
-    favorites.append(city_normalized)
-    save_favorites(favorites)
-    return True
+    return _mutate_favorites(add)
 
 
 def remove_favorite(city: str) -> bool:
@@ -191,17 +715,19 @@ def remove_favorite(city: str) -> bool:
     Returns:
         True if city was removed, False if not found
     """
-    favorites = load_favorites()
-    city_lower = city.strip().lower()
+    city_key = city.strip().casefold()
     
-    # Find and remove (case-insensitive)
-    for i, fav in enumerate(favorites):
-        if fav.lower() == city_lower:
-            favorites.pop(i)
-            save_favorites(favorites)
-            return True
+    def remove(favorites: list) -> bool:
+        if city_key not in _fav_keys:
+            return False
+        # Find and remove (case-insensitive)
+        for i, fav in enumerate(favorites):
+            if fav.casefold() == city_key:
+                del favorites[i]
+                return True
+        return False
     
-    return False
+    return _mutate_favorites(remove)
 
 
 def format_temperature(temp: float) -> str:
@@ -243,6 +769,34 @@ def fahrenheit_to_celsius(fahrenheit: float) -> float:
     return (fahrenheit - 32) * 5 / 9
 
 
+DEFAULT_WEATHER_EMOJI = "🌡️"
+
+# (first id, last id + 1, emoji) - later rows override earlier ones
+_EMOJI_RANGES = (
+    (200, 300, "⛈️"),  # Thunderstorm (2xx)
+    (300, 400, "🌧️"),  # Drizzle (3xx)
+    (500, 600, "🌧️"),  # Rain (5xx)
+    (511, 512, "🌨️"),  # Freezing rain
+    (600, 700, "❄️"),  # Snow (6xx)
+    (700, 800, "🌫️"),  # Atmosphere (7xx) - fog, mist, etc.
+    (800, 801, "☀️"),  # Clear
+    (801, 802, "🌤️"),  # Few clouds
+    (802, 803, "⛅"),  # Scattered clouds
+    (803, 810, "☁️"),  # Broken/overcast clouds
+)
+
+
+def _build_emoji_table() -> tuple:
+    """Expand _EMOJI_RANGES into a tuple indexed directly by weather ID."""
+    table = [DEFAULT_WEATHER_EMOJI] * 1000
+    for start, end, emoji in _EMOJI_RANGES:
+        table[start:end] = [emoji] * (end - start)
+    return tuple(table)
+
+
+_EMOJI_TABLE = _build_emoji_table()
+
+
 def get_weather_emoji(weather_id: int) -> str:
     """
     Get an appropriate emoji for a weather condition ID.
@@ -255,36 +809,18 @@ def get_weather_emoji(weather_id: int) -> str:
     Returns:
         Emoji string representing the weather condition
     """
-    # Thunderstorm (2xx)
-    if 200 <= weather_id < 300:
-        return "⛈️"
-    # Drizzle (3xx)
-    elif 300 <= weather_id < 400:
-        return "🌧️"
-    # Rain (5xx)
-    elif 500 <= weather_id < 600:
-        if weather_id == 511:  # Freezing rain
-            return "🌨️"
-        return "🌧️"
-    # Snow (6xx)
-    elif 600 <= weather_id < 700:
-        return "❄️"
-    # Atmosphere (7xx) - fog, mist, etc.
-    elif 700 <= weather_id < 800:
-        return "🌫️"
-    # Clear (800)
-    elif weather_id == 800:
-        return "☀️"
-    # Clouds (80x)
-    elif 801 <= weather_id < 810:
-        if weather_id == 801:  # Few clouds
-            return "🌤️"
-        elif weather_id == 802:  # Scattered clouds
-            return "⛅"
-        else:  # Broken/overcast clouds
-            return "☁️"
-    else:
-        return "🌡️"
+    # Single index into the precomputed table instead of a range-check chain
+    if 0 <= weather_id < len(_EMOJI_TABLE):
+        return _EMOJI_TABLE[weather_id]
+    return DEFAULT_WEATHER_EMOJI
+
+
+# ASCII characters that can't appear in a city name: anything other than
+# letters, digits, spaces and the punctuation in names like "St. John's" or
+# "Winston-Salem,US". Non-ASCII letters (São Paulo, Kraków) are allowed.
+_CITY_BAD_CHARS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in " ,-'.")
+))
 
 
 def validate_city_name(city: str) -> bool:
@@ -297,15 +833,12 @@ def validate_city_name(city: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not city or not city.strip():
-        return False
+    name = city.strip() if city else ""
+    length = len(name)
     
-    # City name should be at least 2 characters
-    if len(city.strip()) < 2:
+    # City name should be 2-100 characters
+    if length < 2 or length > 100:
         return False
     
-    # City name shouldn't be too long
-    if len(city.strip()) > 100:
-        return False
-    
-    return True
+    # No ASCII symbols or control characters (translate drops any it finds)
+    return len(name.translate(_CITY_BAD_CHARS)) == length
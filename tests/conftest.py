@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures for the Weather Dashboard CLI tests.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import utils
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep API response caching inside a temp directory for every test."""
+    monkeypatch.setattr('utils.CACHE_DIR', tmp_path / "cache")
+    monkeypatch.setattr('utils._cache_enabled', True)
+    monkeypatch.setattr('utils._memory_cache', {})
+    monkeypatch.setattr('utils._cache_conn', None)
+    yield tmp_path / "cache"
+    if utils._cache_conn is not None:
+        utils._cache_conn.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_favorites_cache():
+    """Start every test with an empty in-memory favorites cache."""
+    utils.invalidate_favorites()
+    yield
+    utils.invalidate_favorites()
+
+
+@pytest.fixture(autouse=True)
+def default_terminal_env(monkeypatch):
+    """Clear environment variables that override color detection."""
+    for name in ("NO_COLOR", "FORCE_COLOR", "TTY_COMPATIBLE", "TERM"):
+        monkeypatch.delenv(name, raising=False)
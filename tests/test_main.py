@@ -8,21 +8,27 @@ and display functions work correctly.
 import pytest
 import sys
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 from io import StringIO
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from main import (
+    _console,
+    _render_weather_panel,
     create_parser,
     main,
     display_current_weather,
     display_forecast,
     display_favorites,
+    weather_for_favorites,
     interactive_mode,
+    show_welcome_banner,
     show_main_menu,
     show_favorites_menu,
+    get_temp_style,
+    BANNER_ANSI,
 )
 
 
@@ -85,6 +91,14 @@ class TestArgumentParser:
         args = parser.parse_args(["--remove-favorite", "Chicago"])
         assert args.remove_favorite == "Chicago"
 
+    def test_parser_no_cache_flag(self):
+        """Test parsing no-cache flag."""
+        parser = create_parser()
+        args = parser.parse_args(["London", "--no-cache"])
+        assert args.city_name == "London"
+        assert args.no_cache is True
+        assert parser.parse_args(["London"]).no_cache is False
+
     def test_parser_combined_arguments(self):
         """Test parsing multiple arguments together."""
         parser = create_parser()
@@ -92,6 +106,84 @@ class TestArgumentParser:
         assert args.city == "London"
         assert args.forecast is True
 
+    def test_parser_equals_form(self):
+        """Test parsing --option=value arguments."""
+        parser = create_parser()
+        args = parser.parse_args(["--city=New York,US", "--add=Oslo"])
+        assert args.city == "New York,US"
+        assert args.add_favorite == "Oslo"
+
+    @patch('main._argparse_parser')
+    def test_parser_skips_argparse_for_known_options(self, mock_argparse):
+        """Test that ordinary command lines never build the argparse parser."""
+        args = create_parser().parse_args(["Tokyo", "-f", "--no-cache"])
+        assert (args.city_name, args.forecast, args.no_cache) == ("Tokyo", True, True)
+        mock_argparse.assert_not_called()
+
+    def test_parser_falls_back_to_argparse(self, capsys):
+        """Test that abbreviations and usage errors behave as with argparse."""
+        parser = create_parser()
+        assert parser.parse_args(["--fore", "-c", "Rome"]).forecast is True
+        
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--city"])
+        assert "expected one argument" in capsys.readouterr().err
+
+
+class TestConsole:
+    """Test cases for the shared Rich console."""
+
+    @pytest.mark.skipif(not hasattr(__import__('signal'), 'SIGWINCH'), reason="POSIX only")
+    def test_console_size_pinned_and_updated_on_resize(self, monkeypatch):
+        """Test that a terminal console has a fixed size that follows SIGWINCH."""
+        monkeypatch.setattr('main.console', None)
+        
+        with patch('rich.console.Console.is_terminal', new_callable=PropertyMock, return_value=True), \
+                patch('shutil.get_terminal_size', return_value=os.terminal_size((100, 30))), \
+                patch('signal.signal') as mock_signal:
+            console = _console()
+            assert console is _console()
+            assert (console.width, console.height) == (100, 30)
+            
+            handler = mock_signal.call_args.args[1]
+        
+        with patch('shutil.get_terminal_size', return_value=os.terminal_size((60, 20))):
+            handler(None, None)
+        assert (console.width, console.height) == (60, 20)
+
+
+class TestTemperatureStyles:
+    """Test cases for temperature color bands."""
+
+    def test_get_temp_style_bands(self):
+        """Test Celsius bands, with each threshold belonging to the lower band."""
+        assert get_temp_style(-5) == "bold cyan"
+        assert get_temp_style(0) == "bold cyan"
+        assert get_temp_style(0.5) == "cyan"
+        assert get_temp_style(10) == "cyan"
+        assert get_temp_style(15) == "green"
+        assert get_temp_style(20) == "green"
+        assert get_temp_style(30) == "yellow"
+        assert get_temp_style(30.1) == "bold red"
+
+    def test_weather_panel_temperature_color(self):
+        """Test Fahrenheit bands, with each threshold belonging to the upper band."""
+        def color_for(temp):
+            panel = _render_weather_panel({
+                "main": {"temp": temp, "feels_like": temp, "humidity": 50},
+                "weather": [{"id": 800, "description": "clear sky"}],
+                "wind": {"speed": 1.0},
+                "name": "Testville",
+                "sys": {"country": "US"},
+            })
+            return panel.renderable.split("Temperature: [")[1].split("]")[0]
+        
+        assert color_for(49.9) == "bold cyan"
+        assert color_for(50) == "bold green"
+        assert color_for(68) == "bold yellow"
+        assert color_for(85.9) == "bold yellow"
+        assert color_for(86) == "bold red"
+
 
 class TestDisplayCurrentWeather:
     """Test cases for display_current_weather function."""
@@ -141,6 +233,24 @@ class TestDisplayCurrentWeather:
         result = display_current_weather("Seattle")
         assert result is True
 
+    @patch('main.get_current_weather')
+    def test_display_weather_single_write(self, mock_get_weather):
+        """Test that the whole panel reaches stdout in one write."""
+        mock_get_weather.return_value = {
+            "main": {"temp": 50.0, "feels_like": 48.0, "humidity": 60},
+            "weather": [{"id": 801, "description": "few clouds"}],
+            "wind": {"speed": 7.0},
+            "name": "Dublin",
+            "sys": {"country": "IE"},
+        }
+        
+        with patch('sys.stdout.write', wraps=sys.stdout.write) as mock_write:
+            assert display_current_weather("Dublin") is True
+        
+        writes = [c.args[0] for c in mock_write.call_args_list if c.args[0]]
+        assert len(writes) == 1
+        assert "Dublin" in writes[0]
+
 
 class TestDisplayForecast:
     """Test cases for display_forecast function."""
@@ -165,6 +275,97 @@ class TestDisplayForecast:
         assert result is True
         mock_get_forecast.assert_called_once_with("London")
 
+    @patch('main.get_forecast')
+    def test_display_forecast_one_row_per_day(self, mock_get_forecast, capsys):
+        """Test that every 8th 3-hour entry is shown, one per day."""
+        mock_get_forecast.return_value = {
+            "city": {"name": "London", "country": "GB"},
+            "list": [
+                {
+                    "dt_txt": f"2024-01-{1 + i // 8:02d} {(i % 8) * 3:02d}:00:00",
+                    "main": {"temp": 40.0 + i, "feels_like": 38.0, "humidity": 70},
+                    "weather": [{"id": 500, "description": "light rain"}],
+                    "wind": {"speed": 4.0},
+                }
+                for i in range(40)
+            ],
+        }
+        
+        assert display_forecast("London") is True
+        output = capsys.readouterr().out
+        for day, temp in zip(range(1, 6), ("40.0", "48.0", "56.0", "64.0", "72.0")):
+            assert f"Jan {day:02d}" in output
+            assert f"{temp}°F" in output
+        assert "41.0°F" not in output
+
+    @patch('main.get_forecast')
+    def test_display_forecast_single_write(self, mock_get_forecast):
+        """Test that the forecast table reaches stdout in one write."""
+        mock_get_forecast.return_value = {
+            "city": {"name": "Lima", "country": "PE"},
+            "list": [
+                {
+                    "dt_txt": f"2024-01-{1 + i // 8:02d} {(i % 8) * 3:02d}:00:00",
+                    "main": {"temp": 70.0, "feels_like": 70.0, "humidity": 80},
+                    "weather": [{"id": 804, "description": "overcast clouds"}],
+                    "wind": {"speed": 3.0},
+                }
+                for i in range(40)
+            ],
+        }
+        
+        with patch('sys.stdout.write', wraps=sys.stdout.write) as mock_write:
+            assert display_forecast("Lima") is True
+        
+        writes = [c.args[0] for c in mock_write.call_args_list if c.args[0]]
+        assert len(writes) == 1
+        assert "Lima" in writes[0]
+
+    @patch('main.get_forecast')
+    def test_display_forecast_replays_cached_render(self, mock_get_forecast, capsys):
+        """Test that unchanged forecast data is not rendered twice."""
+        mock_get_forecast.return_value = {
+            "city": {"name": "Oslo", "country": "NO"},
+            "list": [
+                {
+                    "dt_txt": "2024-01-01 12:00:00",
+                    "main": {"temp": 20.0, "feels_like": 15.0, "humidity": 80},
+                    "weather": [{"id": 600, "description": "light snow"}],
+                    "wind": {"speed": 9.0},
+                }
+            ],
+        }
+        
+        assert display_forecast("Oslo") is True
+        first = capsys.readouterr().out
+        
+        with patch('rich.table.Table') as mock_table:
+            assert display_forecast("Oslo") is True
+            mock_table.assert_not_called()
+        assert capsys.readouterr().out == first
+        
+        # Different data renders fresh
+        mock_get_forecast.return_value["list"][0]["main"]["temp"] = 25.0
+        assert display_forecast("Oslo") is True
+        assert "25.0°F" in capsys.readouterr().out
+
+    @patch('main.get_forecast')
+    def test_display_forecast_render_version_invalidates_replay(self, mock_get_forecast, capsys):
+        """Test that bumping FORECAST_RENDER_VERSION stops old renders replaying."""
+        from main import FORECAST_RENDER_VERSION
+        
+        mock_get_forecast.return_value = {
+            "city": {"name": "Oslo", "country": "NO"},
+            "list": [],
+        }
+        
+        with patch('main.get_cached_render', return_value=None) as mock_get_render:
+            assert display_forecast("Oslo") is True
+            with patch('main.FORECAST_RENDER_VERSION', FORECAST_RENDER_VERSION + 1):
+                assert display_forecast("Oslo") is True
+        first_key, second_key = [c.args[0] for c in mock_get_render.call_args_list]
+        assert first_key != second_key
+
     @patch('main.get_forecast')
     def test_display_forecast_city_not_found(self, mock_get_forecast):
         """Test forecast display when city is not found."""
@@ -193,6 +394,95 @@ class TestDisplayFavorites:
         display_favorites()
         mock_load.assert_called_once()
 
+    @patch('main.load_favorites')
+    def test_display_favorites_plain_list(self, mock_load, capsys):
+        """Test that short lists are numbered without a Rich table."""
+        mock_load.return_value = ["London", "Paris"]
+        
+        with patch('rich.table.Table') as mock_table:
+            display_favorites()
+            mock_table.assert_not_called()
+        
+        assert capsys.readouterr().out == "⭐ Favorite Cities\n   1. London\n   2. Paris\n"
+
+    @patch('main.load_favorites', return_value=["London"])
+    def test_display_favorites_plain_on_dumb_terminal(self, mock_load, capsys, monkeypatch):
+        """Test that TERM=dumb gets no color codes, as it would from Rich."""
+        monkeypatch.setenv('TERM', 'dumb')
+        with patch('sys.stdout.isatty', return_value=True):
+            display_favorites()
+        assert capsys.readouterr().out == "⭐ Favorite Cities\n   1. London\n"
+
+    @patch('main.load_favorites', return_value=["London"])
+    def test_display_favorites_honours_force_color(self, mock_load, capsys, monkeypatch):
+        """Test that FORCE_COLOR colors the list even when output is redirected."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        display_favorites()
+        assert "\x1b[1;35m⭐ Favorite Cities\x1b[0m" in capsys.readouterr().out
+
+    @patch('main.load_favorites')
+    def test_display_favorites_long_list_uses_table(self, mock_load, capsys):
+        """Test that very long lists still get a Rich table."""
+        mock_load.return_value = [f"City {i}" for i in range(60)]
+        display_favorites()
+        output = capsys.readouterr().out
+        assert "╭" in output
+        assert "City 59" in output
+
+
+class TestWeatherForFavorites:
+    """Test cases for weather_for_favorites function."""
+
+    @patch('main.get_current_weather')
+    @patch('main.load_favorites')
+    def test_weather_for_favorites_single_write(self, mock_load, mock_get_weather, capsys):
+        """Test that all favorite panels are flushed to stdout together."""
+        mock_load.return_value = ["London", "Paris"]
+        mock_get_weather.side_effect = lambda city: {
+            "main": {"temp": 60.0, "feels_like": 58.0, "humidity": 70},
+            "weather": [{"id": 803, "description": "broken clouds"}],
+            "wind": {"speed": 6.0},
+            "name": city,
+            "sys": {"country": "XX"},
+        }
+        
+        with patch('sys.stdout.write', wraps=sys.stdout.write) as mock_write:
+            weather_for_favorites()
+        
+        writes = [c.args[0] for c in mock_write.call_args_list if c.args[0]]
+        assert len(writes) == 1
+        output = capsys.readouterr().out
+        assert "London" in output
+        assert "Paris" in output
+
+    @patch('main.get_current_weather')
+    @patch('main.load_favorites')
+    def test_weather_for_favorites_fetches_every_city(self, mock_load, mock_get_weather, capsys):
+        """Test that every favorite is fetched and failures are reported in order."""
+        mock_load.return_value = ["London", "Atlantis", "Tokyo"]
+        mock_get_weather.side_effect = lambda city: None if city == "Atlantis" else {
+            "main": {"temp": 75.0, "feels_like": 74.0, "humidity": 40},
+            "weather": [{"id": 800, "description": "clear sky"}],
+            "wind": {"speed": 2.0},
+            "name": city,
+            "sys": {"country": "XX"},
+        }
+        
+        weather_for_favorites()
+        
+        assert mock_get_weather.call_count == 3
+        output = capsys.readouterr().out
+        assert output.index("London") < output.index("Atlantis") < output.index("Tokyo")
+        assert "Could not fetch weather for 'Atlantis'" in output
+
+    @patch('main.get_current_weather')
+    @patch('main.load_favorites')
+    def test_weather_for_favorites_empty(self, mock_load, mock_get_weather):
+        """Test that no API calls are made without favorites."""
+        mock_load.return_value = []
+        weather_for_favorites()
+        mock_get_weather.assert_not_called()
+
 
 class TestMainFunction:
     """Test cases for the main entry point."""
@@ -223,6 +513,15 @@ class TestMainFunction:
         assert result == 0
         mock_save.assert_called_once_with('London')
 
+    @patch('sys.argv', ['main.py', '-a', 'London'])
+    @patch('main.save_favorite', return_value=True)
+    def test_main_add_favorite_plain_on_dumb_terminal(self, mock_save, capsys, monkeypatch):
+        """Test that the Rich-free messages respect TERM=dumb like Rich does."""
+        monkeypatch.setenv('TERM', 'dumb')
+        with patch('sys.stdout.isatty', return_value=True):
+            assert main() == 0
+        assert capsys.readouterr().out == "✓ Added 'London' to favorites!\n"
+
     @patch('sys.argv', ['main.py', '--remove-favorite', 'London'])
     @patch('main.remove_favorite')
     def test_main_remove_favorite(self, mock_remove):
@@ -250,6 +549,44 @@ class TestMainFunction:
         assert result == 0
         mock_display.assert_called_once_with('London')
 
+    @patch('sys.argv', ['main.py', 'Tokyo'])
+    @patch('main.create_parser')
+    @patch('main.display_current_weather')
+    def test_main_positional_city_fast_path(self, mock_display, mock_parser):
+        """Test that a lone city name skips building the argument parser."""
+        mock_display.return_value = False
+        result = main()
+        assert result == 1
+        mock_display.assert_called_once_with('Tokyo')
+        mock_parser.assert_not_called()
+
+    @patch('sys.argv', ['main.py', ''])
+    @patch('main.display_current_weather')
+    def test_main_blank_city_shows_help(self, mock_display, capsys):
+        """Test that an empty city name prints help instead of looking it up."""
+        result = main()
+        assert result == 0
+        mock_display.assert_not_called()
+        assert "usage: weather" in capsys.readouterr().out
+
+    @patch('sys.argv', ['main.py', '  '])
+    @patch('main.create_parser', wraps=create_parser)
+    def test_main_whitespace_city_skips_fast_path(self, mock_parser):
+        """Test that a whitespace-only city name goes through the parser."""
+        with patch('main.display_current_weather', return_value=False):
+            main()
+        mock_parser.assert_called_once()
+
+    @patch('sys.argv', ['main.py', '-l'])
+    @patch('main.create_parser')
+    @patch('main.display_favorites')
+    def test_main_list_favorites_fast_path(self, mock_display, mock_parser):
+        """Test that -l skips building the argument parser."""
+        result = main()
+        assert result == 0
+        mock_display.assert_called_once()
+        mock_parser.assert_not_called()
+
     @patch('sys.argv', ['main.py', '--favorites'])
     @patch('main.weather_for_favorites')
     def test_main_weather_for_favorites(self, mock_weather):
@@ -273,3 +610,184 @@ class TestInteractiveMode:
     def test_interactive_mode_function_exists(self):
         """Test that interactive_mode function exists."""
         assert callable(interactive_mode)
+
+    def test_welcome_banner_uses_baked_ansi_on_terminal(self, capsys):
+        """Test that a color terminal gets the pre-rendered banner as-is."""
+        with patch('sys.stdout.isatty', return_value=True), \
+                patch('shutil.get_terminal_size', return_value=os.terminal_size((100, 40))):
+            show_welcome_banner()
+        assert capsys.readouterr().out == BANNER_ANSI
+
+    def test_welcome_banner_plain_on_dumb_terminal(self, capsys, monkeypatch):
+        """Test that TERM=dumb gets the banner without escape codes, as from Rich."""
+        monkeypatch.setenv('TERM', 'dumb')
+        with patch('sys.stdout.isatty', return_value=True), \
+                patch('shutil.get_terminal_size', return_value=os.terminal_size((100, 40))):
+            show_welcome_banner()
+        output = capsys.readouterr().out
+        assert "W E A T H E R" in output
+        assert "\x1b[" not in output
+
+    def test_baked_banner_matches_markup(self):
+        """Test that BANNER_ANSI is up to date (rerun scripts/bake_banner.py if not)."""
+        from rich.console import Console
+        from main import BANNER_MARKUP
+        
+        buffer = StringIO()
+        Console(file=buffer, force_terminal=True, color_system="standard", width=80).print(BANNER_MARKUP)
+        assert buffer.getvalue() == BANNER_ANSI
+
+    def test_welcome_banner_plain_when_redirected(self, capsys):
+        """Test that redirected output gets the banner without escape codes."""
+        show_welcome_banner()
+        output = capsys.readouterr().out
+        assert "W E A T H E R" in output
+        assert "\x1b[" not in output
+
+    @patch('rich.prompt.Prompt.ask', return_value="2")
+    def test_show_main_menu_reuses_rendered_output(self, mock_ask, capsys):
+        """Test that redrawing the menu reuses the pre-rendered text."""
+        assert show_main_menu() == "2"
+        first = capsys.readouterr().out
+        assert "Main Menu" in first
+        
+        with patch.object(_console(), 'print') as mock_print:
+            assert show_main_menu() == "2"
+            mock_print.assert_not_called()
+        assert capsys.readouterr().out == first
+
+    @patch('rich.prompt.Prompt.ask')
+    @patch('main.show_welcome_banner')
+    def test_interactive_mode_exit(self, mock_banner, mock_ask, capsys):
+        """Test that choosing Exit prints the goodbye message and returns 0."""
+        mock_ask.return_value = "5"
+        
+        assert interactive_mode() == 0
+        output = capsys.readouterr().out
+        assert "Thanks for using Weather Dashboard" in output
+        assert "Clear skies ahead" in output
+
+    @patch('builtins.input', return_value="")
+    @patch('main.remove_favorite', return_value=True)
+    @patch('main.load_favorites', return_value=["London", "Paris [FR]"])
+    @patch('rich.prompt.Prompt.ask')
+    @patch('main.show_welcome_banner')
+    def test_interactive_mode_remove_favorite(self, mock_banner, mock_ask, mock_load,
+                                              mock_remove, mock_input, capsys):
+        """Test the remove-favorite flow lists favorites before prompting."""
+        # Main menu -> favorites, remove -> "London", back, exit
+        mock_ask.side_effect = ["3", "3", "London", "4", "5"]
+        
+        assert interactive_mode() == 0
+        mock_remove.assert_called_once_with("London")
+        output = capsys.readouterr().out
+        assert "1. London" in output
+        assert "2. Paris [FR]" in output  # Listed verbatim, not parsed as markup
+        assert "Removed 'London' from favorites" in output
+
+    @patch('main.remove_favorite', return_value=True)
+    @patch('main.load_favorites', return_value=["London"])
+    @patch('rich.prompt.Prompt.ask', return_value="London")
+    def test_remove_favorite_listing_leaves_cities_unstyled(self, mock_ask, mock_load,
+                                                            mock_remove):
+        """Test that only the header and numbers of the favorites listing are styled."""
+        from rich.console import Console
+        from main import _do_remove_favorite
+        
+        buffer = StringIO()
+        color_console = Console(file=buffer, force_terminal=True, color_system="standard", width=80)
+        with patch('main.console', color_console):
+            _do_remove_favorite()
+        output = buffer.getvalue()
+        assert "\x1b[1;35m" in output  # Header
+        assert "\x1b[0m London\n" in output  # City follows the reset, with no style of its own
+
+    @patch('builtins.input', return_value="")
+    @patch('main.save_favorite', return_value=True)
+    @patch('rich.prompt.Prompt.ask')
+    @patch('main.show_welcome_banner')
+    def test_interactive_mode_add_favorite(self, mock_banner, mock_ask, mock_save,
+                                           mock_input, capsys):
+        """Test the submenu loops until "back", then returns to the main menu."""
+        # Main menu -> favorites, add "Oslo", add "Rome", back, exit
+        mock_ask.side_effect = ["3", "2", "Oslo", "2", "Rome", "4", "5"]
+        
+        assert interactive_mode() == 0
+        assert [c.args[0] for c in mock_save.call_args_list] == ["Oslo", "Rome"]
+        # Only the main-menu action pauses for Enter
+        mock_input.assert_called_once()
+
+    @patch('builtins.input', return_value="")
+    @patch('main.prefetch_forecast')
+    @patch('main.get_current_weather', return_value=None)
+    @patch('rich.prompt.Confirm.ask', return_value=False)
+    @patch('rich.prompt.Prompt.ask')
+    @patch('main.show_welcome_banner')
+    def test_current_weather_prefetches_forecast(self, mock_banner, mock_ask, mock_confirm,
+                                                 mock_weather, mock_prefetch, mock_input):
+        """Test that looking up current weather also fetches that city's forecast."""
+        import threading
+        
+        prefetched = threading.Event()
+        mock_prefetch.side_effect = lambda city: prefetched.set()
+        mock_ask.side_effect = ["1", "Oslo", "5"]
+        
+        assert interactive_mode() == 0
+        mock_weather.assert_called_once_with("Oslo")
+        assert prefetched.wait(timeout=5)
+        mock_prefetch.assert_called_once_with("Oslo")
+
+    @patch('main.get_current_weather', return_value={"name": "Oslo"})
+    @patch('main._show_weather')
+    @patch('main.prefetch_forecast')
+    @patch('rich.prompt.Confirm.ask', return_value=False)
+    @patch('rich.prompt.Prompt.ask', return_value="Oslo")
+    def test_current_weather_shown_before_forecast_finishes(self, mock_ask, mock_confirm,
+                                                          mock_prefetch, mock_show, mock_weather):
+        """Test that the weather panel doesn't wait on the background forecast."""
+        import threading
+        from main import _do_current_weather
+        
+        release = threading.Event()
+        finished = threading.Event()
+        
+        def slow_prefetch(city):
+            release.wait(timeout=5)
+            finished.set()
+        
+        mock_prefetch.side_effect = slow_prefetch
+        mock_show.side_effect = lambda city, data: finished.is_set()
+        
+        try:
+            _do_current_weather()
+            mock_show.assert_called_once_with("Oslo", {"name": "Oslo"})
+            assert not finished.is_set()
+        finally:
+            release.set()
+        assert finished.wait(timeout=5)
+
+    def test_pending_prefetch_does_not_delay_exit(self):
+        """Test that quitting doesn't wait for a forecast still being fetched."""
+        import subprocess
+        import time
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = (
+            "import sys, time; sys.path.insert(0, sys.argv[1]); import main; "
+            "main.prefetch_forecast = lambda city: time.sleep(30); "
+            "main.get_current_weather = lambda city: None; "
+            "main.cache_enabled = lambda: True; "
+            "main._prefetch_both('Oslo')"
+        )
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", code, src_dir], check=True, timeout=20)
+        assert time.monotonic() - start < 10
+
+    @patch('main.prefetch_forecast')
+    @patch('main.get_current_weather', return_value=None)
+    def test_prefetch_skipped_without_cache(self, mock_weather, mock_forecast):
+        """Test that --no-cache doesn't make a forecast request nobody will reuse."""
+        from main import _prefetch_both
+        
+        with patch('main.cache_enabled', return_value=False):
+            assert _prefetch_both("Oslo") is None
+        mock_forecast.assert_not_called()
@@ -24,11 +24,17 @@ from utils import (
     validate_city_name,
     load_favorites,
     save_favorites,
+    invalidate_favorites,
     save_favorite,
     remove_favorite,
     get_api_key,
     get_current_weather,
     get_forecast,
+    prefetch_forecast,
+    set_cache_enabled,
+    clear_weather_cache,
+    get_cached_render,
+    save_cached_render,
 )
 
 
@@ -50,6 +56,12 @@ class TestTemperatureFormatting:
         result = format_temperature(0.0)
         assert result == "0.0°F"
 
+    def test_format_temperature_signed_zero(self):
+        """Test that 0.0 and -0.0 format independently of call order."""
+        assert format_temperature(0.0) == "0.0°F"
+        assert format_temperature(-0.0) == "-0.0°F"
+        assert format_temperature(0.0) == "0.0°F"
+
     def test_format_temperature_rounding(self):
         """Test that temperature is rounded to 1 decimal place."""
         result = format_temperature(74.456)
@@ -151,6 +163,13 @@ class TestWeatherEmoji:
         """Test emoji for unknown weather code."""
         assert get_weather_emoji(999) == "🌡️"
 
+    def test_emoji_out_of_range(self):
+        """Test emoji for codes outside the lookup table and unused ranges."""
+        assert get_weather_emoji(-1) == "🌡️"
+        assert get_weather_emoji(1200) == "🌡️"
+        assert get_weather_emoji(450) == "🌡️"
+        assert get_weather_emoji(810) == "🌡️"
+
 
 class TestCityNameValidation:
     """Test cases for city name validation."""
@@ -186,6 +205,17 @@ class TestCityNameValidation:
         """Test validation with leading/trailing spaces."""
         assert validate_city_name("  London  ") is True
 
+    def test_validate_punctuation_in_names(self):
+        """Test validation allows the punctuation real city names use."""
+        assert validate_city_name("St. John's") is True
+        assert validate_city_name("Winston-Salem,US") is True
+
+    def test_validate_rejects_symbols(self):
+        """Test validation rejects ASCII symbols and control characters."""
+        assert validate_city_name("London; rm -rf") is False
+        assert validate_city_name("<Paris>") is False
+        assert validate_city_name("Oslo\tNorway") is False
+
 
 class TestFavoritesManagement:
     """Test cases for favorites file management."""
@@ -213,6 +243,20 @@ class TestFavoritesManagement:
         result = load_favorites()
         assert result == ["London", "Paris"]
 
+    def test_save_favorites_keeps_indented_json(self, tmp_path, monkeypatch):
+        """Test that saved favorites stay human-readable and round-trip."""
+        favorites_file = tmp_path / "favorites.json"
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert save_favorites(["São Paulo", "Paris"]) is True
+        assert json.loads(favorites_file.read_text(encoding="utf-8")) == {
+            "favorites": ["São Paulo", "Paris"]
+        }
+        assert '\n  "favorites"' in favorites_file.read_text(encoding="utf-8")
+        
+        invalidate_favorites()
+        assert load_favorites() == ["São Paulo", "Paris"]
+
     def test_load_favorites_invalid_json(self, tmp_path, monkeypatch):
         """Test loading favorites from corrupted file."""
         favorites_file = tmp_path / "favorites.json"
@@ -266,6 +310,17 @@ class TestFavoritesManagement:
         result = save_favorite("LONDON")
         assert result is False
 
+    def test_save_favorite_keeps_name_as_typed(self, tmp_path, monkeypatch):
+        """Test that favorites keep their capitalization and compare by casefold."""
+        favorites_file = tmp_path / "favorites.json"
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert save_favorite("  New York,US ") is True
+        assert save_favorite("Straße") is True
+        assert save_favorite("new york,us") is False
+        assert save_favorite("STRASSE") is False
+        assert load_favorites() == ["New York,US", "Straße"]
+
     def test_remove_favorite_existing(self, tmp_path, monkeypatch):
         """Test removing an existing favorite city."""
         favorites_file = tmp_path / "favorites.json"
@@ -289,6 +344,132 @@ class TestFavoritesManagement:
         result = remove_favorite("Tokyo")
         assert result is False
 
+    def test_load_favorites_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that favorites are re-read only when the file is modified."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert load_favorites() == ["London"]
+        with patch('builtins.open') as mock_open:
+            assert load_favorites() == ["London"]
+            mock_open.assert_not_called()
+        
+        favorites_file.write_text('{"favorites": ["London", "Oslo"]}')
+        os.utime(favorites_file, ns=(0, os.stat(favorites_file).st_mtime_ns + 10**9))
+        assert load_favorites() == ["London", "Oslo"]
+
+    def test_load_favorites_notices_same_mtime_rewrite(self, tmp_path, monkeypatch):
+        """Test that a rewrite with an unchanged mtime but new size is picked up."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["Oslo"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        mtime_ns = os.stat(favorites_file).st_mtime_ns
+        
+        assert load_favorites() == ["Oslo"]
+        favorites_file.write_text('{"favorites": ["Oslo", "Rome"]}')
+        os.utime(favorites_file, ns=(mtime_ns, mtime_ns))
+        assert load_favorites() == ["Oslo", "Rome"]
+
+    def test_load_favorites_returns_copy(self, tmp_path, monkeypatch):
+        """Test that changing the returned list doesn't alter the cache."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["Oslo"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        load_favorites().append("Rome")
+        assert load_favorites() == ["Oslo"]
+
+    def test_save_favorite_updates_cache(self, tmp_path, monkeypatch):
+        """Test that adding and removing favorites keeps the cache current."""
+        favorites_file = tmp_path / "favorites.json"
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert save_favorite("Lima") is True
+        assert load_favorites() == ["Lima"]
+        assert remove_favorite("Lima") is True
+        assert load_favorites() == []
+
+    def test_unchanged_favorites_not_rewritten(self, tmp_path, monkeypatch):
+        """Test that a duplicate add or unknown remove doesn't touch the file."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        with patch('utils.save_favorites') as mock_save:
+            assert save_favorite("london") is False
+            assert remove_favorite("Paris") is False
+            mock_save.assert_not_called()
+
+    def test_save_favorites_failure_keeps_old_file(self, tmp_path, monkeypatch):
+        """Test that a failed save leaves the previous file and no temp files."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        with patch('utils.os.replace', side_effect=OSError("disk full")):
+            assert save_favorites(["London", "Oslo"]) is False
+        
+        assert [p.name for p in tmp_path.iterdir()] == ["favorites.json"]
+        assert load_favorites() == ["London"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX only")
+    def test_save_favorites_keeps_file_mode(self, tmp_path, monkeypatch):
+        """Test that saving doesn't change an existing file's permissions."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London"]}')
+        favorites_file.chmod(0o644)
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert save_favorites(["London", "Oslo"]) is True
+        assert favorites_file.stat().st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX only")
+    def test_save_favorites_new_file_uses_umask(self, tmp_path, monkeypatch):
+        """Test that a first save creates the file with the usual umask default."""
+        favorites_file = tmp_path / "favorites.json"
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        old_umask = os.umask(0o022)
+        try:
+            assert save_favorites(["Oslo"]) is True
+        finally:
+            os.umask(old_umask)
+        assert favorites_file.stat().st_mode & 0o777 == 0o644
+
+    def test_save_favorites_leaves_process_umask_alone(self, tmp_path, monkeypatch):
+        """Test that saving never changes the umask other threads rely on."""
+        monkeypatch.setattr('utils.FAVORITES_FILE', tmp_path / "favorites.json")
+        
+        with patch('utils.os.umask') as mock_umask:
+            assert save_favorites(["Oslo"]) is True
+        mock_umask.assert_not_called()
+
+    def test_remove_favorite_keeps_duplicate_check_in_sync(self, tmp_path, monkeypatch):
+        """Test that a hand-edited duplicate is still found after removing one copy."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London", "london"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        
+        assert remove_favorite("LONDON") is True
+        assert save_favorite("London") is False
+        assert remove_favorite("London") is True
+        assert save_favorite("London") is True
+
+    def test_invalidate_favorites_forces_reread(self, tmp_path, monkeypatch):
+        """Test that invalidating the cache picks up same-mtime edits."""
+        favorites_file = tmp_path / "favorites.json"
+        favorites_file.write_text('{"favorites": ["London"]}')
+        monkeypatch.setattr('utils.FAVORITES_FILE', favorites_file)
+        mtime_ns = os.stat(favorites_file).st_mtime_ns
+        
+        assert load_favorites() == ["London"]
+        favorites_file.write_text('{"favorites": ["Oslo"]}')
+        os.utime(favorites_file, ns=(mtime_ns, mtime_ns))
+        
+        invalidate_favorites()
+        assert load_favorites() == ["Oslo"]
+
 
 class TestApiKey:
     """Test cases for API key handling."""
@@ -309,24 +490,60 @@ class TestApiKey:
         result = get_api_key()
         assert result == 'test_api_key_123'
 
+    def test_get_api_key_loads_environment_on_first_use(self, monkeypatch):
+        """Test that the key is read from the environment when first needed."""
+        monkeypatch.setattr('utils.API_KEY', None)
+        monkeypatch.setenv('OPENWEATHERMAP_API_KEY', 'env_key')
+        
+        with patch('dotenv.load_dotenv') as mock_load_dotenv:
+            assert get_api_key() == 'env_key'
+            mock_load_dotenv.assert_not_called()  # Already set; .env not needed
+
+    def test_get_api_key_reads_dotenv_once(self, monkeypatch):
+        """Test that .env is parsed on first use when the key isn't exported."""
+        monkeypatch.setattr('utils.API_KEY', None)
+        monkeypatch.delenv('OPENWEATHERMAP_API_KEY', raising=False)
+        
+        def fake_load_dotenv():
+            os.environ['OPENWEATHERMAP_API_KEY'] = 'dotenv_key'
+        
+        with patch('dotenv.load_dotenv', side_effect=fake_load_dotenv) as mock_load_dotenv:
+            assert get_api_key() == 'dotenv_key'
+            assert get_api_key() == 'dotenv_key'
+            mock_load_dotenv.assert_called_once()
+        monkeypatch.delenv('OPENWEATHERMAP_API_KEY')
+
+    def test_import_defers_requests_and_dotenv(self):
+        """Test that importing utils doesn't import requests, dotenv or sqlite3."""
+        import subprocess
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import utils; "
+            "print('requests' in sys.modules, 'dotenv' in sys.modules, 'sqlite3' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, src_dir], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False False False"
+
 
 class TestApiCalls:
     """Test cases for API call functions."""
 
-    @patch('utils.requests.get')
+    @patch('requests.Session.get')
     def test_get_current_weather_success(self, mock_get, monkeypatch):
         """Test successful weather API call."""
         monkeypatch.setattr('utils.API_KEY', 'test_key')
         
         mock_response = MagicMock()
-        mock_response.json.return_value = {"main": {"temp": 20}}
+        mock_response.content = json.dumps({"main": {"temp": 20}}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
         result = get_current_weather("London")
         assert result == {"main": {"temp": 20}}
 
-    @patch('utils.requests.get')
+    @patch('requests.Session.get')
     def test_get_current_weather_no_api_key(self, mock_get, monkeypatch):
         """Test weather API call without API key."""
         monkeypatch.setattr('utils.API_KEY', '')
@@ -335,20 +552,20 @@ class TestApiCalls:
         assert result is None
         mock_get.assert_not_called()
 
-    @patch('utils.requests.get')
+    @patch('requests.Session.get')
     def test_get_forecast_success(self, mock_get, monkeypatch):
         """Test successful forecast API call."""
         monkeypatch.setattr('utils.API_KEY', 'test_key')
         
         mock_response = MagicMock()
-        mock_response.json.return_value = {"city": {"name": "London"}, "list": []}
+        mock_response.content = json.dumps({"city": {"name": "London"}, "list": []}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
         result = get_forecast("London")
         assert result["city"]["name"] == "London"
 
-    @patch('utils.requests.get')
+    @patch('requests.Session.get')
     def test_get_weather_connection_error(self, mock_get, monkeypatch):
         """Test weather API call with connection error."""
         monkeypatch.setattr('utils.API_KEY', 'test_key')
@@ -359,7 +576,82 @@ class TestApiCalls:
         result = get_current_weather("London")
         assert result is None
 
-    @patch('utils.requests.get')
+    @patch('requests.Session.get')
+    def test_prefetch_forecast_is_quiet_on_error(self, mock_get, monkeypatch, capsys):
+        """Test that a failed background forecast fetch prints nothing."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        
+        import requests
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        
+        assert prefetch_forecast("London") is None
+        assert capsys.readouterr().out == ""
+
+    @patch('requests.Session.get')
+    def test_get_forecast_keeps_only_displayed_fields(self, mock_get, monkeypatch):
+        """Test that unused forecast fields are dropped before caching."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        
+        entry = {
+            "dt": 1733745600,
+            "dt_txt": "2024-12-09 12:00:00",
+            "main": {"temp": 60.1, "feels_like": 58.0, "humidity": 70, "pressure": 1012},
+            "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],
+            "wind": {"speed": 8.2, "deg": 240},
+            "clouds": {"all": 75},
+        }
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "cod": "200",
+            "city": {"name": "London", "country": "GB", "timezone": 0},
+            "list": [entry],
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        assert get_forecast("London") == {
+            "city": {"name": "London", "country": "GB"},
+            "list": [{
+                "dt_txt": "2024-12-09 12:00:00",
+                "main": {"temp": 60.1, "feels_like": 58.0, "humidity": 70},
+                "weather": [{"id": 500, "description": "light rain"}],
+                "wind": {"speed": 8.2},
+            }],
+        }
+
+    @patch('requests.Session.get')
+    def test_api_calls_share_session(self, mock_get, monkeypatch):
+        """Test that current weather and forecast go through the pooled session."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"city": {"name": "Rome"}, "list": []}).encode()
+        mock_get.return_value = mock_response
+        
+        with patch('requests.get') as mock_requests_get:
+            get_current_weather("Rome")
+            get_forecast("Rome")
+            mock_requests_get.assert_not_called()
+        
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["timeout"] == 10
+        assert [c.args[0] for c in mock_get.call_args_list] == [
+            "https://api.openweathermap.org/data/2.5/weather",
+            "https://api.openweathermap.org/data/2.5/forecast",
+        ]
+
+    @patch('requests.Session.get')
+    def test_get_weather_invalid_json(self, mock_get, monkeypatch):
+        """Test weather API call with a malformed response body."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        
+        mock_response = MagicMock()
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_get.return_value = mock_response
+        
+        assert get_current_weather("London") is None
+        assert get_forecast("London") is None
+
+    @patch('requests.Session.get')
     def test_get_weather_timeout(self, mock_get, monkeypatch):
         """Test weather API call with timeout."""
         monkeypatch.setattr('utils.API_KEY', 'test_key')
@@ -369,3 +661,187 @@ class TestApiCalls:
         
         result = get_current_weather("London")
         assert result is None
+
+
+class TestResponseCache:
+    """Test cases for the API response cache."""
+
+    @staticmethod
+    def _mock_response(data, status_code=200, headers=None):
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.headers = headers or {}
+        mock_response.content = json.dumps(data).encode()
+        mock_response.raise_for_status = MagicMock()
+        return mock_response
+
+    @patch('requests.Session.get')
+    def test_repeat_lookup_uses_cache(self, mock_get, monkeypatch):
+        """Test that a second lookup for the same city skips the API."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"main": {"temp": 20}})
+        
+        assert get_current_weather("London") == {"main": {"temp": 20}}
+        assert get_current_weather("  london ") == {"main": {"temp": 20}}
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_cache_persists_to_disk(self, mock_get, monkeypatch, isolated_cache):
+        """Test that cached responses survive a fresh process (empty memory cache)."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"city": {"name": "Paris"}, "list": []})
+        
+        get_forecast("Paris")
+        assert (isolated_cache / "cache.db").exists()
+        
+        monkeypatch.setattr('utils._memory_cache', {})
+        assert get_forecast("Paris")["city"]["name"] == "Paris"
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_expired_rows_purged_on_open(self, mock_get, monkeypatch, isolated_cache):
+        """Test that opening the cache database drops expired rows."""
+        import sqlite3
+        import utils
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"main": {"temp": 20}})
+        
+        with patch('utils.time.time', return_value=1000.0):
+            get_current_weather("London")
+        utils._cache_conn.close()
+        monkeypatch.setattr('utils._cache_conn', None)
+        utils._cache_db()
+        
+        conn = sqlite3.connect(isolated_cache / "cache.db")
+        assert conn.execute("SELECT COUNT(*) FROM api_cache").fetchone()[0] == 0
+        conn.close()
+
+    @patch('requests.Session.get')
+    def test_old_cache_database_rebuilt(self, mock_get, monkeypatch, isolated_cache):
+        """Test that a cache database from before the ETag column still works."""
+        import sqlite3
+        isolated_cache.mkdir(parents=True)
+        conn = sqlite3.connect(isolated_cache / "cache.db")
+        conn.execute("CREATE TABLE api_cache (k TEXT PRIMARY KEY, v BLOB, exp REAL)")
+        conn.commit()
+        conn.close()
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"city": {"name": "Oslo"}, "list": []})
+        
+        get_forecast("Oslo")
+        monkeypatch.setattr('utils._memory_cache', {})
+        assert get_forecast("Oslo")["city"]["name"] == "Oslo"
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_cache_entries_expire(self, mock_get, monkeypatch):
+        """Test that entries older than their TTL are fetched again."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"main": {"temp": 20}})
+        
+        with patch('utils.time.time', return_value=1000.0):
+            get_current_weather("London")
+        with patch('utils.time.time', return_value=1000.0 + 299):
+            get_current_weather("London")
+        assert mock_get.call_count == 1
+        
+        with patch('utils.time.time', return_value=1000.0 + 300):
+            get_current_weather("London")
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_expired_forecast_revalidated_with_etag(self, mock_get, monkeypatch):
+        """Test that a stale forecast is reused when the server answers 304."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        forecast = {"city": {"name": "Paris"}, "list": []}
+        mock_get.side_effect = [
+            self._mock_response(forecast, headers={"ETag": '"v1"'}),
+            self._mock_response(None, status_code=304),
+        ]
+        
+        with patch('utils.time.time', return_value=1000.0):
+            get_forecast("Paris")
+        monkeypatch.setattr('utils._memory_cache', {})  # Reload from disk
+        with patch('utils.time.time', return_value=1000.0 + 1800):
+            assert get_forecast("Paris") == forecast
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        
+        # The revalidated copy is fresh again
+        with patch('utils.time.time', return_value=1000.0 + 1800 + 60):
+            assert get_forecast("Paris") == forecast
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_forecast_without_etag_sends_plain_request(self, mock_get, monkeypatch):
+        """Test that no conditional header is sent when nothing can be revalidated."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"city": {"name": "Rome"}, "list": []})
+        
+        with patch('utils.time.time', return_value=1000.0):
+            get_forecast("Rome")
+        with patch('utils.time.time', return_value=1000.0 + 1800):
+            get_forecast("Rome")
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+    @patch('requests.Session.get')
+    def test_clear_weather_cache(self, mock_get, monkeypatch, isolated_cache):
+        """Test that clearing the cache forces a fresh fetch."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"main": {"temp": 20}})
+        
+        get_current_weather("London")
+        clear_weather_cache()
+        monkeypatch.setattr('utils._memory_cache', {})
+        get_current_weather("London")
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_cache_disabled(self, mock_get, monkeypatch, isolated_cache):
+        """Test that disabling the cache always hits the API."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        mock_get.return_value = self._mock_response({"main": {"temp": 20}})
+        
+        set_cache_enabled(False)
+        get_current_weather("London")
+        get_current_weather("London")
+        assert mock_get.call_count == 2
+        assert not isolated_cache.exists()
+
+    @patch('requests.Session.get')
+    def test_failed_lookup_not_cached(self, mock_get, monkeypatch):
+        """Test that errors are not cached."""
+        monkeypatch.setattr('utils.API_KEY', 'test_key')
+        
+        import requests
+        mock_get.side_effect = [
+            requests.exceptions.Timeout(),
+            self._mock_response({"main": {"temp": 20}}),
+        ]
+        
+        assert get_current_weather("London") is None
+        assert get_current_weather("London") == {"main": {"temp": 20}}
+
+
+class TestRenderCache:
+    """Test cases for the rendered-output cache."""
+
+    def test_render_cache_round_trip(self):
+        """Test that saved output is returned for the same key."""
+        assert get_cached_render("abc123") is None
+        save_cached_render("abc123", "\x1b[1mTable\x1b[0m\n")
+        assert get_cached_render("abc123") == "\x1b[1mTable\x1b[0m\n"
+
+    def test_render_cache_prunes_old_entries(self, isolated_cache):
+        """Test that entries older than RENDER_CACHE_MAX_AGE are removed."""
+        save_cached_render("old", "stale")
+        os.utime(isolated_cache / "render" / "old", (0, 0))
+        save_cached_render("new", "fresh")
+        assert get_cached_render("old") is None
+        assert get_cached_render("new") == "fresh"
+
+    def test_render_cache_disabled(self):
+        """Test that --no-cache also bypasses rendered output."""
+        save_cached_render("abc123", "cached")
+        set_cache_enabled(False)
+        assert get_cached_render("abc123") is None